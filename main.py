@@ -15,14 +15,17 @@ Usage::
     uv run main.py --portfolio mag_seven --strategy ml --no-risk
 """
 import argparse
-import json
 import os
 import shutil
 import sys
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, List
 
 from dotenv import load_dotenv
 from loguru import logger
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from src.rwaengine.utils.logger import setup_logger
 
@@ -31,10 +34,20 @@ load_dotenv()
 
 from src.rwaengine.core.engine import BlackLittermanEngine  # noqa: E402
 from src.rwaengine.data.adapters.yfinance_adapter import YFinanceAdapter  # noqa: E402
+from src.rwaengine.data.cache import CachedMarketDataProvider  # noqa: E402
+from src.rwaengine.data.transforms import to_price_matrix  # noqa: E402
 from src.rwaengine.execution.risk_manager import PortfolioRiskManager  # noqa: E402
 from src.rwaengine.oracle.nav_reporter import NAVReporter  # noqa: E402
 from src.rwaengine.strategy.factory import StrategyFactory  # noqa: E402
+from src.rwaengine.strategy.types import InvestorView  # noqa: E402
 from src.rwaengine.utils.portfolio_loader import PortfolioLoader  # noqa: E402
+from src.rwaengine.utils.time_tools import last_session_end  # noqa: E402
+
+# Serialises view lists straight from the models in a single Rust pass.
+_VIEWS_ADAPTER = TypeAdapter(List[InvestorView])
+
+# Fields kept in the strategy_views.json audit file.
+_VIEW_DEBUG_FIELDS = {"assets", "expected_return", "confidence", "description"}
 
 
 # ---------------------------------------------------------------------------
@@ -60,11 +73,28 @@ def create_outcome_dir(
     return target_dir
 
 
-def save_json(data: dict, folder: str, filename: str) -> None:
-    """Serialise *data* as pretty-printed JSON into *folder*/*filename*."""
+def save_json(data: Any, folder: str, filename: str) -> None:
+    """Serialise *data* as pretty-printed JSON into *folder*/*filename*.
+
+    Uses pydantic-core's Rust encoder (already a dependency via pydantic)
+    rather than the stdlib ``json`` module.  Output is UTF-8 without ASCII
+    escaping, matching the previous ``ensure_ascii=False`` behaviour.
+    """
     path = os.path.join(folder, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(path, "wb") as f:
+        f.write(to_json(data, indent=2))
+    logger.success(f"Saved {filename}")
+
+
+def save_views(views: List[InvestorView], folder: str, filename: str) -> None:
+    """Write the audit subset of *views* as pretty-printed JSON."""
+    path = os.path.join(folder, filename)
+    with open(path, "wb") as f:
+        f.write(
+            _VIEWS_ADAPTER.dump_json(
+                views, indent=2, include={"__all__": _VIEW_DEBUG_FIELDS},
+            )
+        )
     logger.success(f"Saved {filename}")
 
 
@@ -123,21 +153,17 @@ def main() -> None:
         logger.info(f"Target assets: {tickers}")
 
         lookback_days = 365
-        end_date = date.today()
+        # Snap to the last completed session so weekend reruns share a cache key.
+        end_date = last_session_end()
         start_date = end_date - timedelta(days=lookback_days)
 
-        adapter = YFinanceAdapter()
-        fetch_list = list(set(tickers + ["SPY", "^VIX"]))
+        adapter = CachedMarketDataProvider(YFinanceAdapter())
+        fetch_list = list(dict.fromkeys([*tickers, "SPY", "^VIX"]))
 
         df_market = adapter.fetch_history(
             fetch_list, start_date=start_date, end_date=end_date,
         )
-        prices = (
-            df_market
-            .pivot(index="trade_date", columns="ticker", values="adj_close")
-            .ffill()
-            .dropna()
-        )
+        prices = to_price_matrix(df_market)
 
         invest_prices = prices[tickers]
         current_prices = invest_prices.iloc[-1]
@@ -154,22 +180,19 @@ def main() -> None:
         }
 
         generator = StrategyFactory.get_generator(args.strategy, **factory_kwargs)
-        views = generator.generate_views(current_prices)
+
+        # View generation (LLM/ML) and covariance estimation are independent;
+        # overlap them so the slow API call hides the shrinkage estimate.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            views_future = pool.submit(generator.generate_views, current_prices)
+            engine_future = pool.submit(BlackLittermanEngine, prices=invest_prices)
+            views = views_future.result()
+            engine = engine_future.result()
 
         # Persist views for debugging / audit.
-        views_debug = [
-            {
-                "assets": v.assets,
-                "expected_return": v.expected_return,
-                "confidence": v.confidence,
-                "description": v.description,
-            }
-            for v in views
-        ]
-        save_json(views_debug, output_dir, "strategy_views.json")
+        save_views(views, output_dir, "strategy_views.json")
 
         # ---- Black-Litterman optimisation ----
-        engine = BlackLittermanEngine(prices=invest_prices)
         market_caps = {t: 1e12 for t in tickers}
         raw_result = engine.run_optimization(market_caps, views)
 
@@ -5,13 +5,14 @@ Usage::
 
     uv run run_backtest.py --view-source json
     uv run run_backtest.py --view-source ml --years 5
+    uv run run_backtest.py --view-source ml --years 5 --workers 8
     uv run run_backtest.py --view-source llm --years 1   # caution: API costs
 """
 import argparse
 import os
 import shutil
 import sys
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 
 import pandas as pd
 from loguru import logger
@@ -21,7 +22,9 @@ sys.path.append("src")
 
 from src.rwaengine.utils.logger import setup_logger  # noqa: E402
 
-setup_logger()
+# --workers can fan rebalances out to a process pool, so the shared log
+# file must be written through Loguru's multiprocess-safe queue.
+setup_logger(enqueue=True)
 
 from dotenv import load_dotenv  # noqa: E402
 
@@ -32,8 +35,11 @@ from src.rwaengine.analysis.benchmark import BenchmarkProvider  # noqa: E402
 from src.rwaengine.analysis.plotter import PerformancePlotter  # noqa: E402
 from src.rwaengine.analysis.strategies import BLStrategy, MarkowitzStrategy  # noqa: E402
 from src.rwaengine.data.adapters.yfinance_adapter import YFinanceAdapter  # noqa: E402
+from src.rwaengine.data.cache import CachedMarketDataProvider  # noqa: E402
+from src.rwaengine.data.transforms import to_price_matrix  # noqa: E402
 from src.rwaengine.execution.risk_manager import PortfolioRiskManager  # noqa: E402
 from src.rwaengine.utils.portfolio_loader import PortfolioLoader  # noqa: E402
+from src.rwaengine.utils.time_tools import last_session_end  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -100,6 +106,11 @@ def main() -> None:
         "--view-file", type=str, default="portfolios/views_backtest.json",
         help="Path to the JSON view file (only used with --view-source=json)",
     )
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="Rebalance across dates in this many worker processes "
+             "(default: one thread per strategy)",
+    )
 
     args = parser.parse_args()
 
@@ -108,12 +119,13 @@ def main() -> None:
     tickers = loader.get_tickers(args.portfolio)
 
     # Always include SPY (benchmark) and VIX (fear gauge) in the download.
-    fetch_list = list(set(tickers + ["SPY", "^VIX"]))
+    fetch_list = list(dict.fromkeys([*tickers, "SPY", "^VIX"]))
 
     # Extra warm-up year so rolling indicators have enough history.
     warmup_years = 1
     total_fetch_days = (args.years + warmup_years) * 365
-    end_date = date.today()
+    # Snap to the last completed session so weekend reruns share a cache key.
+    end_date = last_session_end()
     start_date = end_date - timedelta(days=total_fetch_days)
 
     logger.info(
@@ -124,14 +136,24 @@ def main() -> None:
         f"Fetch: {args.years + warmup_years} yr (incl. warm-up)"
     )
 
-    adapter = YFinanceAdapter()
+    adapter = CachedMarketDataProvider(YFinanceAdapter())
     df_market = adapter.fetch_history(fetch_list, start_date, end_date)
-    prices = (
-        df_market
-        .pivot(index="trade_date", columns="ticker", values="adj_close")
-        .ffill()
-        .dropna()
-    )
+
+    # Skip the first ~252 trading days (1 year) to allow warm-up.
+    sim_start_idx = 252
+    min_rows = sim_start_idx + 20
+
+    # Cheap probe on the raw frame so a too-short window fails before the
+    # reshape.  The price matrix can only lose rows (dropna), so this never
+    # rejects a window the full check below would accept.
+    if df_market.empty or df_market["trade_date"].nunique() < min_rows:
+        logger.error("Not enough data to run the backtest. Exiting.")
+        return
+
+    prices = to_price_matrix(df_market)
+    if len(prices) < min_rows:
+        logger.error("Not enough data to run the backtest. Exiting.")
+        return
 
     spy_prices = prices["SPY"]
     vix_prices = prices.get("^VIX")
@@ -161,14 +183,16 @@ def main() -> None:
     # ---- Walk-forward backtest ----
     backtester = Backtester(prices=invest_prices, strategies=strategies)
 
-    # Skip the first ~252 trading days (1 year) to allow warm-up.
-    sim_start_idx = 252
-    if len(prices) < sim_start_idx + 20:
-        logger.error("Not enough data to run the backtest. Exiting.")
-        return
-
     sim_start_date = str(prices.index[sim_start_idx].date())
-    df_strategies, weights_dict = backtester.run(start_date=sim_start_date)
+    # Strategies are independent, so rebalance them side by side.  With
+    # --workers every rebalance date is farmed out to a process pool.
+    if args.workers > 1:
+        run_kwargs = {"n_jobs": args.workers, "backend": "process"}
+    else:
+        run_kwargs = {"n_jobs": len(strategies)}
+    df_strategies, weights_dict = backtester.run(
+        start_date=sim_start_date, **run_kwargs,
+    )
 
     # ---- Benchmark curves ----
     logger.info("Computing benchmarks...")
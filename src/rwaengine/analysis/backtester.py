@@ -6,13 +6,99 @@ each registered strategy for new portfolio weights, then computes daily
 returns weighted by those allocations.  Returns both cumulative return
 curves and a full audit trail of historical weights.
 """
+import numpy as np
 import pandas as pd
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import timedelta
+from itertools import repeat
 from loguru import logger
-from typing import Dict, List, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 
 from src.rwaengine.analysis.strategies import BaseStrategy
 
+ExecutorBackend = Literal["thread", "process"]
+
+
+# ---------------------------------------------------------------------------
+# Numeric kernels
+# ---------------------------------------------------------------------------
+
+def _weights_to_vector(
+    weights: Dict[str, float],
+    col_idx: Dict[str, int],
+) -> np.ndarray:
+    """Align a ``{ticker: weight}`` mapping to the price columns.
+
+    Args:
+        weights: Strategy allocation keyed by ticker.
+        col_idx: Ticker → column position in the price matrix.
+
+    Tickers missing from *col_idx* (including the ``USDC`` cash leg, which
+    earns nothing in the simulation) contribute zero.
+    """
+    vec = np.zeros(len(col_idx))
+    for ticker, weight in weights.items():
+        pos = col_idx.get(ticker)
+        if pos is not None and ticker != "USDC":
+            vec[pos] = weight
+    return vec
+
+
+def _record_weights(
+    row: np.ndarray,
+    seen: np.ndarray,
+    weights: Dict[str, float],
+    col_idx: Dict[str, int],
+) -> None:
+    """Write a weights mapping into a preallocated history row in place.
+
+    *seen* flags every column a strategy has ever reported, so the final
+    audit frame only carries tickers that actually appeared.
+    """
+    for ticker, weight in weights.items():
+        pos = col_idx.get(ticker)
+        if pos is not None:
+            row[pos] = weight
+            seen[pos] = True
+
+
+def _safe_rebalance(
+    strat: BaseStrategy,
+    hist_data: pd.DataFrame,
+    period_start: pd.Timestamp,
+) -> Optional[Dict[str, float]]:
+    """Run one strategy's rebalance, logging and swallowing failures.
+
+    Module-level (rather than a closure) so it can be shipped to a
+    process pool.
+    """
+    try:
+        return strat.rebalance(hist_data)
+    except Exception as e:
+        logger.error(
+            f"Strategy {strat.name} failed at "
+            f"{period_start.date()}: {e}"
+        )
+        return None
+
+
+def _weighted_returns(
+    returns: np.ndarray,
+    weights: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Portfolio daily returns for a (days × assets) return matrix.
+
+    *weights* may be a single (assets,) vector or an (assets × strategies)
+    matrix, in which case every strategy is evaluated in one GEMM.  When
+    *out* is given the product is written straight into it.
+    """
+    return np.matmul(returns, weights, out=out)
+
+
+# ---------------------------------------------------------------------------
+# Backtester
+# ---------------------------------------------------------------------------
 
 class Backtester:
     """Walk-forward backtester that supports an arbitrary list of strategies."""
@@ -27,16 +113,38 @@ class Backtester:
         self.prices = prices
         self.strategies = strategies
 
+        # Ticker → column position, shared by every period's weight matrix.
+        self._col_idx: Dict[str, int] = {
+            t: j for j, t in enumerate(prices.columns)
+        }
+
     def run(
         self,
         start_date: str,
         rebalance_freq_days: int = 20,
+        n_jobs: int = 1,
+        backend: ExecutorBackend = "thread",
     ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """Execute the walk-forward simulation.
 
         Args:
             start_date: ISO-format date string for the first rebalancing point.
             rebalance_freq_days: Calendar-day gap between rebalancing events.
+            n_jobs: Number of strategies to rebalance concurrently at each
+                    rebalancing date.  ``1`` keeps the original serial loop.
+            backend: Worker type used when *n_jobs* > 1.  ``"thread"`` suits
+                     strategies whose work runs in native code or waits on
+                     I/O (LLM views); strategies are rebalanced concurrently
+                     one date at a time.  ``"process"`` sidesteps the GIL for
+                     CPU-bound work; strategies and price windows are
+                     pickled per call, so any state a strategy mutates during
+                     ``rebalance`` is not carried over between dates.  Since
+                     calls are then independent, every (date, strategy)
+                     rebalance is submitted up front and all *n_jobs*
+                     workers stay busy.
+
+        Raises:
+            ValueError: If *backend* is not recognised.
 
         Returns:
             A tuple of:
@@ -49,73 +157,218 @@ class Backtester:
         start_idx = full_dates.get_indexer(
             [pd.Timestamp(start_date)], method="nearest"
         )[0]
-        rebalance_dates = full_dates[start_idx::rebalance_freq_days]
+        rebalance_pos = np.arange(start_idx, len(full_dates), rebalance_freq_days)
+        rebalance_dates = full_dates[rebalance_pos]
+
+        # First row of each rebalance's 1-year lookback window, resolved once
+        # so the loop slices by position instead of by label.
+        lookback_pos = full_dates.searchsorted(
+            rebalance_dates - timedelta(days=365), side="left"
+        )
+
+        # Daily returns for the whole history, computed once.  Row k holds the
+        # return from day k-1 to day k; rows touching a missing price are
+        # skipped, matching the per-period pct_change().dropna() it replaces.
+        returns_np = self.prices.pct_change().to_numpy()
+        valid_rows = ~np.isnan(returns_np).any(axis=1)
 
-        strategy_returns: Dict[str, list] = {s.name: [] for s in self.strategies}
-        weights_history: Dict[str, list] = {s.name: [] for s in self.strategies}
+        strategy_names = [s.name for s in self.strategies]
+
+        # Every simulated day's returns land in one preallocated (T × S)
+        # buffer; T is known up front from the rebalance grid.
+        if len(rebalance_pos) > 1:
+            sim_rows = slice(rebalance_pos[0] + 1, rebalance_pos[-1] + 1)
+            sim_index = full_dates[sim_rows][valid_rows[sim_rows]]
+        else:
+            sim_index = full_dates[:0]
+        daily_buf = np.empty((len(sim_index), len(strategy_names)))
+        write_pos = 0
+
+        # Weight audit trail: one dense row per rebalance and strategy, with
+        # columns = price tickers + the USDC cash leg.
+        hist_cols = list(self.prices.columns)
+        if "USDC" not in self._col_idx:
+            hist_cols.append("USDC")
+        hist_idx = {t: j for j, t in enumerate(hist_cols)}
+        max_rows = max(len(rebalance_dates) - 1, 0)
+        weight_buf = {n: np.zeros((max_rows, len(hist_cols))) for n in strategy_names}
+        weight_seen = {n: np.zeros(len(hist_cols), dtype=bool) for n in strategy_names}
+        weight_dates: Dict[str, list] = {n: [] for n in strategy_names}
 
         # Every strategy starts fully in cash (USDC) until its first rebalance.
         current_weights: Dict[str, Dict[str, float]] = {
             s.name: {"USDC": 1.0} for s in self.strategies
         }
 
-        for i in range(len(rebalance_dates) - 1):
-            period_start = rebalance_dates[i]
-            period_end = rebalance_dates[i + 1]
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown executor backend: {backend}")
+
+        # Let strategies precompute inputs for every date that will actually
+        # rebalance (enough lookback history, not the terminal date).
+        eligible = (rebalance_pos[:-1] - lookback_pos[:-1] + 1) > 100
+        for strat in self.strategies:
+            strat.prepare(self.prices, rebalance_dates[:-1][eligible])
 
-            # Build a 1-year lookback window for strategy signals.
-            lookback_start = period_start - timedelta(days=365)
-            hist_data = self.prices.loc[lookback_start:period_start]
+        # The (tickers × strategies) weight matrix only changes on a
+        # successful rebalance, so it is rebuilt lazily.
+        weight_mat: Optional[np.ndarray] = None
+        weights_dirty = True
 
-            # Only rebalance when enough history is available.
-            if len(hist_data) > 100:
-                for strat in self.strategies:
-                    try:
-                        new_weights = strat.rebalance(hist_data)
+        executor: Optional[Executor] = None
+        if n_jobs > 1:
+            pool_cls = ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+            executor = pool_cls(max_workers=n_jobs)
+
+        try:
+            prefetched: Optional[Dict[int, List[Optional[Dict[str, float]]]]] = None
+            if executor is not None and backend == "process":
+                prefetched = self._rebalance_all_dates(
+                    np.flatnonzero(eligible), lookback_pos, rebalance_pos,
+                    rebalance_dates, executor,
+                )
+
+            for i in range(len(rebalance_dates) - 1):
+                period_start = rebalance_dates[i]
+
+                # Build a 1-year lookback window for strategy signals.
+                hist_data = self.prices.iloc[lookback_pos[i]:rebalance_pos[i] + 1]
+
+                # Only rebalance when enough history is available.
+                if len(hist_data) > 100:
+                    if prefetched is not None:
+                        results = prefetched[i]
+                    else:
+                        results = self._rebalance_all(hist_data, period_start, executor)
+                    for strat, new_weights in zip(self.strategies, results):
                         if new_weights:
                             current_weights[strat.name] = new_weights
+                            weights_dirty = True
 
                             # Snapshot the weights for post-hoc analysis.
-                            record = new_weights.copy()
-                            record["Date"] = period_start
-                            weights_history[strat.name].append(record)
-
-                    except Exception as e:
-                        logger.error(
-                            f"Strategy {strat.name} failed at "
-                            f"{period_start.date()}: {e}"
-                        )
-
-            # Compute weighted daily returns for the period.
-            period_prices = self.prices.loc[period_start:period_end]
-            period_rets = period_prices.pct_change().dropna()
-
-            for strat_name in strategy_returns:
-                w = current_weights[strat_name]
-                daily = pd.Series(0.0, index=period_rets.index)
-                for ticker, weight in w.items():
-                    if ticker != "USDC" and ticker in period_rets.columns:
-                        daily += period_rets[ticker] * weight
-                strategy_returns[strat_name].append(daily)
-
-            if i % 10 == 0:
-                logger.info(f"Step {period_start.date()}: rebalanced.")
-
-        # Assemble cumulative return curves.
+                            row = len(weight_dates[strat.name])
+                            _record_weights(
+                                weight_buf[strat.name][row],
+                                weight_seen[strat.name],
+                                new_weights,
+                                hist_idx,
+                            )
+                            weight_dates[strat.name].append(period_start)
+
+                # Returns realised between this rebalance and the next one.
+                rows = slice(rebalance_pos[i] + 1, rebalance_pos[i + 1] + 1)
+                period_rets = returns_np[rows][valid_rows[rows]]
+
+                if weights_dirty:
+                    weight_mat = np.column_stack([
+                        _weights_to_vector(current_weights[name], self._col_idx)
+                        for name in strategy_names
+                    ])
+                    # Tickers no strategy holds only multiply zeros; keep the
+                    # union of held columns so the GEMM shrinks to K ≤ N.
+                    held = np.flatnonzero(weight_mat.any(axis=1))
+                    if len(held) < len(weight_mat):
+                        weight_mat = weight_mat[held]
+                    else:
+                        held = None
+                    all_cash = len(weight_mat) == 0
+                    weights_dirty = False
+
+                n_days = len(period_rets)
+                period_out = daily_buf[write_pos:write_pos + n_days]
+                if all_cash:
+                    # Cold start: every strategy still sits in USDC.
+                    period_out[:] = 0.0
+                else:
+                    # One GEMM per period covers every strategy.
+                    if held is not None:
+                        period_rets = period_rets[:, held]
+                    _weighted_returns(period_rets, weight_mat, out=period_out)
+                write_pos += n_days
+
+                if i % 10 == 0:
+                    logger.info(f"Step {period_start.date()}: rebalanced.")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Assemble cumulative return curves in one cumprod over (T × S).
         result_df = pd.DataFrame()
-        for name, ret_list in strategy_returns.items():
-            if ret_list:
-                full_series = pd.concat(ret_list)
-                result_df[name] = (1 + full_series).cumprod()
+        if len(rebalance_pos) > 1:
+            result_df = pd.DataFrame(
+                np.cumprod(1.0 + daily_buf, axis=0),
+                index=sim_index,
+                columns=strategy_names,
+            )
 
         # Assemble weight audit trail.
         final_weights: Dict[str, pd.DataFrame] = {}
-        for name, records in weights_history.items():
-            if records:
-                df_w = pd.DataFrame(records)
-                if not df_w.empty:
-                    df_w.set_index("Date", inplace=True)
-                    df_w = df_w.fillna(0.0)
-                    final_weights[name] = df_w
-
-        return result_df, final_weights
\ No newline at end of file
+        for name in strategy_names:
+            n_rows = len(weight_dates[name])
+            if n_rows:
+                seen = weight_seen[name]
+                final_weights[name] = pd.DataFrame(
+                    weight_buf[name][:n_rows, seen],
+                    index=pd.DatetimeIndex(weight_dates[name], name="Date"),
+                    columns=[c for c, keep in zip(hist_cols, seen) if keep],
+                )
+
+        return result_df, final_weights
+
+    def _rebalance_all(
+        self,
+        hist_data: pd.DataFrame,
+        period_start: pd.Timestamp,
+        executor: Optional[Executor] = None,
+    ) -> List[Optional[Dict[str, float]]]:
+        """Ask every strategy for new weights on the same lookback window.
+
+        Strategies are independent of each other, so when an *executor* is
+        supplied they are dispatched concurrently.
+
+        Returns:
+            One entry per strategy, in registration order.  ``None`` marks a
+            strategy that raised.
+        """
+        if executor is None:
+            return [
+                _safe_rebalance(strat, hist_data, period_start)
+                for strat in self.strategies
+            ]
+        return list(
+            executor.map(
+                _safe_rebalance,
+                self.strategies,
+                repeat(hist_data),
+                repeat(period_start),
+            )
+        )
+
+    def _rebalance_all_dates(
+        self,
+        date_idx: np.ndarray,
+        lookback_pos: np.ndarray,
+        rebalance_pos: np.ndarray,
+        rebalance_dates: pd.DatetimeIndex,
+        executor: Executor,
+    ) -> Dict[int, List[Optional[Dict[str, float]]]]:
+        """Submit every (date, strategy) rebalance to *executor* at once.
+
+        Only valid when calls do not share state across dates (process
+        pools).  Each task receives its own lookback slice.
+
+        Returns:
+            Rebalance index → per-strategy results in registration order.
+        """
+        futures = {
+            i: [
+                executor.submit(
+                    _safe_rebalance,
+                    strat,
+                    self.prices.iloc[lookback_pos[i]:rebalance_pos[i] + 1],
+                    rebalance_dates[i],
+                )
+                for strat in self.strategies
+            ]
+            for i in date_idx
+        }
+        return {i: [f.result() for f in fs] for i, fs in futures.items()}
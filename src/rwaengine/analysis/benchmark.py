@@ -5,9 +5,21 @@ Provides static methods for computing buy-and-hold cumulative returns of
 common benchmarks (SPY, equal-weight basket) aligned to a strategy's
 date index so they can be plotted side-by-side.
 """
+import numpy as np
 import pandas as pd
 
 
+def _align_returns(
+    rets: np.ndarray,
+    source_index: pd.Index,
+    target_index: pd.DatetimeIndex,
+) -> np.ndarray:
+    """Gather *rets* onto *target_index*; missing dates and NaNs become 0."""
+    pos = source_index.get_indexer(target_index)
+    aligned = np.where(pos >= 0, rets[pos], 0.0)
+    return np.nan_to_num(aligned, nan=0.0)
+
+
 class BenchmarkProvider:
     """Utility class for computing benchmark cumulative-return curves."""
 
@@ -25,9 +37,16 @@ class BenchmarkProvider:
         Returns:
             Cumulative-return series starting at 1.0.
         """
-        rets = spy_prices.pct_change()
-        aligned_rets = rets.reindex(target_index).fillna(0.0)
-        return (1 + aligned_rets).cumprod()
+        prices = spy_prices.to_numpy(dtype=np.float64)
+        rets = np.full_like(prices, np.nan)
+        rets[1:] = prices[1:] / prices[:-1] - 1.0
+
+        aligned_rets = _align_returns(rets, spy_prices.index, target_index)
+        return pd.Series(
+            np.cumprod(1.0 + aligned_rets),
+            index=target_index,
+            name=spy_prices.name,
+        )
 
     @staticmethod
     def calculate_equal_weight(
@@ -45,7 +64,17 @@ class BenchmarkProvider:
         Returns:
             Cumulative-return series starting at 1.0.
         """
-        daily_rets = asset_prices.pct_change()
-        eq_rets = daily_rets.mean(axis=1)
-        aligned_rets = eq_rets.reindex(target_index).fillna(0.0)
-        return (1 + aligned_rets).cumprod()
\ No newline at end of file
+        prices = asset_prices.to_numpy(dtype=np.float64)
+        daily_rets = np.full_like(prices, np.nan)
+        daily_rets[1:] = prices[1:] / prices[:-1] - 1.0
+
+        # NaN-skipping row mean without nanmean's empty-slice warnings.
+        valid = ~np.isnan(daily_rets)
+        counts = valid.sum(axis=1)
+        totals = np.where(valid, daily_rets, 0.0).sum(axis=1)
+        eq_rets = np.divide(
+            totals, counts, out=np.full(len(totals), np.nan), where=counts > 0,
+        )
+
+        aligned_rets = _align_returns(eq_rets, asset_prices.index, target_index)
+        return pd.Series(np.cumprod(1.0 + aligned_rets), index=target_index)
\ No newline at end of file
@@ -7,12 +7,16 @@ Generates two types of publication-quality plots:
   2. **Allocation history** — stacked-area chart of portfolio weights
      over time for each strategy.
 """
-import matplotlib.gridspec as gridspec
+from typing import List, Tuple
+
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 import numpy as np
 import pandas as pd
 from loguru import logger
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 
 class PerformancePlotter:
@@ -28,6 +32,8 @@ class PerformancePlotter:
     def _calculate_metrics(self, cum_series: pd.Series) -> dict:
         """Compute annualized Sharpe, Sortino, and total return.
 
+        Single-series form of :meth:`_calculate_metrics_batch`.
+
         Args:
             cum_series: Cumulative-return series starting at 1.0.
 
@@ -35,34 +41,56 @@ class PerformancePlotter:
             Dict with string-formatted ``"Sharpe"``, ``"Sortino"``, and
             ``"Return"`` values.
         """
-        daily_ret = cum_series.pct_change().dropna()
-        risk_free_daily = 0.04 / 252
-        total_ret = cum_series.iloc[-1] - 1.0
+        return self._calculate_metrics_batch(cum_series.to_frame())[0]
 
-        mean_ret = daily_ret.mean()
-        std_dev = daily_ret.std()
+    def _calculate_metrics_batch(self, cum_df: pd.DataFrame) -> List[dict]:
+        """Compute annualized Sharpe, Sortino, and total return per column.
 
-        if std_dev == 0:
-            return {
-                "Sharpe": "0.00",
-                "Sortino": "0.00",
-                "Return": f"{total_ret:.2%}",
-            }
+        All columns are handled in one vectorized pass; NaN returns are
+        masked per column.
 
-        sharpe = (mean_ret - risk_free_daily) / std_dev * np.sqrt(252)
+        Args:
+            cum_df: Cumulative-return curves, one column per strategy.
 
-        downside_std = daily_ret[daily_ret < 0].std()
-        sortino = (
-            (mean_ret - risk_free_daily) / downside_std * np.sqrt(252)
-            if downside_std > 0
-            else 0.0
-        )
+        Returns:
+            One metrics dict per column, in column order.
+        """
+        values = cum_df.to_numpy(dtype=np.float64)
+        daily_ret = values[1:] / values[:-1] - 1.0
+        valid = ~np.isnan(daily_ret)
+        risk_free_daily = 0.04 / 252
+        total_ret = values[-1] - 1.0
 
-        return {
-            "Sharpe": f"{sharpe:.2f}",
-            "Sortino": f"{sortino:.2f}",
-            "Return": f"{total_ret:.2%}",
-        }
+        def masked_mean_std(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            n = mask.sum(axis=0)
+            x = np.where(mask, daily_ret, 0.0)
+            mean = np.divide(
+                x.sum(axis=0), n, out=np.full(n.shape, np.nan), where=n > 0,
+            )
+            sq_dev = np.where(mask, (daily_ret - mean) ** 2, 0.0).sum(axis=0)
+            std = np.sqrt(
+                np.divide(sq_dev, n - 1, out=np.zeros(n.shape), where=n > 1)
+            )
+            return mean, std
+
+        mean_ret, std_dev = masked_mean_std(valid)
+        _, downside_std = masked_mean_std(valid & (daily_ret < 0))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            excess = (mean_ret - risk_free_daily) * np.sqrt(252)
+            sharpe = np.where(std_dev == 0, 0.0, excess / std_dev)
+            sortino = np.where(
+                (std_dev == 0) | ~(downside_std > 0), 0.0, excess / downside_std,
+            )
+
+        return [
+            {
+                "Sharpe": f"{sh:.2f}",
+                "Sortino": f"{so:.2f}",
+                "Return": f"{tr:.2%}",
+            }
+            for sh, so, tr in zip(sharpe, sortino, total_ret)
+        ]
 
     # ------------------------------------------------------------------
     # Dual-panel comparison chart
@@ -85,11 +113,13 @@ class PerformancePlotter:
         logger.info("Generating dual-panel comparison plot...")
 
         # Canvas: 3:1 height ratio between return panel and VIX panel.
-        fig = plt.figure(figsize=(16, 12))
-        gs = gridspec.GridSpec(2, 1, height_ratios=[3, 1], hspace=0.05)
+        # Constrained layout resolves spacing while drawing, so savefig does
+        # not need a second bbox_inches="tight" render pass.
+        fig = plt.figure(figsize=(16, 12), layout="constrained")
+        gs = fig.add_gridspec(2, 1, height_ratios=[3, 1])
 
-        ax_main = plt.subplot(gs[0])
-        ax_vix = plt.subplot(gs[1], sharex=ax_main)
+        ax_main = fig.add_subplot(gs[0])
+        ax_vix = fig.add_subplot(gs[1], sharex=ax_main)
 
         # --- Top panel: cumulative returns ---
         color_map = {
@@ -100,17 +130,32 @@ class PerformancePlotter:
         }
         fallback_colors = list(color_map.values())
 
-        df_pct = (df_cumulative - 1) * 100
-        metrics_data = []
-
-        for i, col in enumerate(df_pct.columns):
-            color = color_map.get(col, fallback_colors[i % len(fallback_colors)])
-            ax_main.plot(
-                df_pct.index, df_pct[col],
-                label=col, linewidth=2, color=color, alpha=0.9,
-            )
+        columns = list(df_cumulative.columns)
+        colors = [
+            color_map.get(col, fallback_colors[i % len(fallback_colors)])
+            for i, col in enumerate(columns)
+        ]
+
+        # All curves go into one LineCollection (a single artist) rather than
+        # one Line2D per column; the legend uses proxy handles instead.
+        x = mdates.date2num(df_cumulative.index.to_numpy())
+        y = (df_cumulative.to_numpy(dtype=np.float64) - 1) * 100
+        segments = np.stack(
+            [np.broadcast_to(x, y.T.shape), y.T], axis=-1,
+        )
+        ax_main.add_collection(
+            LineCollection(segments, colors=colors, linewidths=2, alpha=0.9)
+        )
+        ax_main.xaxis_date()
+        ax_main.autoscale_view()
+        handles = [
+            Line2D([], [], color=color, linewidth=2, alpha=0.9, label=col)
+            for col, color in zip(columns, colors)
+        ]
 
-            m = self._calculate_metrics(df_cumulative[col])
+        metrics_data = []
+        all_metrics = self._calculate_metrics_batch(df_cumulative)
+        for col, color, m in zip(columns, colors, all_metrics):
             metrics_data.append({
                 "text": f"{col}:\nSharpe: {m['Sharpe']}\nReturn: {m['Return']}",
                 "color": color,
@@ -125,7 +170,7 @@ class PerformancePlotter:
             linestyle="-", linewidth=0.5, alpha=0.3,
         )
         ax_main.legend(
-            loc="upper left", fontsize=10,
+            handles=handles, loc="upper left", fontsize=10,
             facecolor="#1a1a1a", edgecolor="gray",
         )
         ax_main.yaxis.set_major_formatter(mtick.PercentFormatter())
@@ -149,39 +194,53 @@ class PerformancePlotter:
 
         # --- Bottom panel: VIX fear gauge ---
         if vix_series is not None:
-            vix = vix_series.reindex(df_cumulative.index).ffill().fillna(0)
+            dates = df_cumulative.index
+            vix = vix_series.reindex(dates).to_numpy(dtype=np.float64)
+
+            # Forward-fill by carrying the last valid position; leading gaps → 0.
+            last_valid = np.where(~np.isnan(vix), np.arange(len(vix)), -1)
+            np.maximum.accumulate(last_valid, out=last_valid)
+            vix = np.where(last_valid >= 0, vix[last_valid], 0.0)
+            vix_max = vix.max()
 
             ax_vix.plot(
-                vix.index, vix, color="#aa00ff", linewidth=1.5, label="^VIX",
+                dates, vix, color="#aa00ff", linewidth=1.5, label="^VIX",
+            )
+            ax_vix.fill_between(
+                dates, vix, 0, color="#aa00ff", alpha=0.1, rasterized=True,
             )
-            ax_vix.fill_between(vix.index, vix, 0, color="#aa00ff", alpha=0.1)
 
             # Threshold lines for market-regime context.
             ax_vix.axhline(y=25, color="red", linestyle="--", linewidth=1, alpha=0.7)
             ax_vix.text(
-                vix.index[0], 26, "PANIC (>25)",
+                dates[0], 26, "PANIC (>25)",
                 color="red", fontsize=8, fontweight="bold",
             )
 
             ax_vix.axhline(y=15, color="green", linestyle="--", linewidth=1, alpha=0.7)
             ax_vix.text(
-                vix.index[0], 16, "CALM (<15)",
+                dates[0], 16, "CALM (<15)",
                 color="green", fontsize=8, fontweight="bold",
             )
 
-            # Shade the high-fear region for visual emphasis.
+            # Shade the high-fear region for visual emphasis.  Clipping at the
+            # threshold gives zero-height bands below 25, so no where=/
+            # interpolate crossing search is needed.
             ax_vix.fill_between(
-                vix.index, vix, 25,
-                where=(vix >= 25), color="red", alpha=0.3, interpolate=True,
+                dates, np.maximum(vix, 25), 25,
+                color="red", alpha=0.3, rasterized=True,
             )
 
             ax_vix.set_ylabel("VIX Index", fontsize=10)
-            ax_vix.set_ylim(10, max(40, vix.max() + 5))
+            ax_vix.set_ylim(10, max(40, vix_max + 5))
             ax_vix.grid(True, axis="y", linestyle="--", alpha=0.3)
             ax_vix.set_facecolor("#0f0f0f")
 
         output_file = "comparison_result.png"
-        plt.savefig(output_file, dpi=300, bbox_inches="tight")
+        fig.savefig(output_file, dpi=200)
+
+        # pyplot keeps every open figure alive; release it once saved.
+        plt.close(fig)
         logger.success(f"Dashboard saved to {output_file}")
 
     # ------------------------------------------------------------------
@@ -211,12 +270,14 @@ class PerformancePlotter:
             else:
                 cols = mean_weights.index.tolist()
 
-            df_plot = df_weights[cols]
+            # One (series × dates) array in the layout stackplot consumes,
+            # instead of a transposed DataFrame it would convert again.
+            layers = np.ascontiguousarray(df_weights[cols].to_numpy(dtype=np.float64).T)
 
             colors = plt.cm.tab20.colors
             ax.stackplot(
-                df_plot.index, df_plot.T,
-                labels=df_plot.columns, colors=colors, alpha=0.85,
+                df_weights.index, layers,
+                labels=cols, colors=colors, alpha=0.85,
             )
 
             ax.set_title(
@@ -240,5 +301,6 @@ class PerformancePlotter:
                 strat_name.replace(" ", "_").replace("(", "").replace(")", "")
             )
             output_file = f"allocation_{safe_name}.png"
-            plt.savefig(output_file, dpi=300, bbox_inches="tight")
+            fig.savefig(output_file, dpi=300, bbox_inches="tight")
+            plt.close(fig)
             logger.success(f"Allocation plot saved to {output_file}")
\ No newline at end of file
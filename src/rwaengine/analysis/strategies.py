@@ -9,15 +9,19 @@ Provides a pluggable strategy hierarchy:
 """
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 import pandas as pd
 from loguru import logger
-from pypfopt import EfficientFrontier, expected_returns, risk_models
 
+from src.rwaengine.core.covariance import ledoit_wolf_covariance, simple_returns
 from src.rwaengine.core.engine import BlackLittermanEngine
+from src.rwaengine.core.optimization import max_sharpe
 from src.rwaengine.execution.risk_manager import PortfolioRiskManager
-from src.rwaengine.strategy.types import OptimizationResult
+from src.rwaengine.strategy.base import ViewGenerator
+from src.rwaengine.strategy.factory import StrategyFactory
+from src.rwaengine.strategy.generators.json_loader import JsonViewGenerator
+from src.rwaengine.strategy.types import InvestorView, OptimizationResult
 
 ViewSourceType = Literal["json", "ml", "llm"]
 
@@ -33,9 +37,33 @@ class BaseStrategy(ABC):
         self.name = name
         self.risk_manager = risk_manager
 
-    @abstractmethod
     def rebalance(self, history: pd.DataFrame, **kwargs) -> Dict[str, float]:
-        """Return target portfolio weights given recent price history."""
+        """Return target portfolio weights given recent price history.
+
+        A failed optimisation is logged and yields an empty mapping, which
+        the backtester treats as "keep the current weights".
+        """
+        try:
+            return self._rebalance_impl(history, **kwargs)
+        except Exception as e:
+            # Positional args: Loguru only formats them if WARNING is enabled.
+            logger.warning("[{}] Optimization failed: {}", self.name, e)
+            return {}
+
+    @abstractmethod
+    def _rebalance_impl(
+        self, history: pd.DataFrame, **kwargs
+    ) -> Dict[str, float]:
+        """Strategy-specific rebalance; may raise on optimiser failure."""
+
+    def prepare(
+        self, prices: pd.DataFrame, rebalance_dates: pd.DatetimeIndex
+    ) -> None:
+        """Hook called once before a backtest with every rebalance date.
+
+        Strategies can use it to precompute inputs in bulk.  The default
+        does nothing.
+        """
 
     def _apply_risk_or_pass(
         self, raw_result: OptimizationResult
@@ -51,27 +79,29 @@ class BaseStrategy(ABC):
 class MarkowitzStrategy(BaseStrategy):
     """Mean-variance optimisation targeting the maximum Sharpe ratio."""
 
-    def rebalance(self, history: pd.DataFrame, **kwargs) -> Dict[str, float]:
-        try:
-            mu = expected_returns.mean_historical_return(history)
-            cov = risk_models.CovarianceShrinkage(history).ledoit_wolf()
-
-            ef = EfficientFrontier(mu, cov)
-            ef.max_sharpe(risk_free_rate=0.04)
-            cleaned = ef.clean_weights()
-
-            raw_res = OptimizationResult(
-                tickers=list(cleaned.keys()),
-                weights=list(cleaned.values()),
-                expected_return=0,
-                volatility=0,
-                sharpe_ratio=0,
-            )
-            return self._apply_risk_or_pass(raw_res)
+    def _rebalance_impl(
+        self, history: pd.DataFrame, **kwargs
+    ) -> Dict[str, float]:
+        # One return matrix feeds both the mean and the covariance.
+        returns = simple_returns(history)
 
-        except Exception as e:
-            logger.warning(f"[{self.name}] Optimization failed: {e}")
-            return {}
+        # Imported here so importing the strategies never loads PyPortfolioOpt
+        # (and its cvxpy solver stack) until a Markowitz rebalance runs.
+        from pypfopt import expected_returns
+
+        mu = expected_returns.mean_historical_return(returns, returns_data=True)
+        cov = ledoit_wolf_covariance(history, returns=returns)
+
+        cleaned, _ = max_sharpe(mu, cov, risk_free_rate=0.04)
+
+        raw_res = OptimizationResult(
+            tickers=list(cleaned.keys()),
+            weights=list(cleaned.values()),
+            expected_return=0,
+            volatility=0,
+            sharpe_ratio=0,
+        )
+        return self._apply_risk_or_pass(raw_res)
 
 
 class BLStrategy(BaseStrategy):
@@ -101,45 +131,99 @@ class BLStrategy(BaseStrategy):
         self.view_file = view_file
         self.mock_caps: Optional[Dict[str, float]] = None
 
+        # Built on first use and reused across rebalances.
+        self._generator: Optional[ViewGenerator] = None
+
+        # Views prefetched by ``prepare``, keyed by rebalance date.
+        self._views_cache: Dict[pd.Timestamp, List[InvestorView]] = {}
+
         # Only needed for the LLM path; loaded eagerly so we can warn early.
+        # Without a key every rebalance would fail to build the generator,
+        # so the strategy degrades to the view-less (prior-only) BL path.
         self.api_key = os.getenv("GEMINI_API_KEY")
-        if self.view_source == "llm" and not self.api_key:
-            logger.warning("LLM mode selected but GEMINI_API_KEY is not set!")
+        self._degraded = self.view_source == "llm" and not self.api_key
+        if self._degraded:
+            logger.warning(
+                "LLM mode selected but GEMINI_API_KEY is not set! "
+                "Running on the market prior without views."
+            )
 
-    def _get_generator(self, history: pd.DataFrame):
-        """Instantiate the appropriate view generator for the configured source.
+    def __getstate__(self) -> dict:
+        # Generators can hold live API clients; a process-pool worker
+        # rebuilds its own instead of receiving a pickled one.
+        state = self.__dict__.copy()
+        state["_generator"] = None
+        return state
+
+    def _get_generator(self, history: pd.DataFrame) -> ViewGenerator:
+        """Return the view generator for the configured source.
+
+        The generator is created once and reused, so the LLM client is not
+        re-initialised on every rebalance.  The ML generator is re-pointed
+        at the current *history* window before being returned.
 
         JSON mode bypasses the factory so that a custom *view_file* path can
         be forwarded.  ML and LLM modes use the standard ``StrategyFactory``.
         """
+        if self._generator is not None:
+            if self.view_source == "ml":
+                self._generator.update_history(history)
+            return self._generator
+
         if self.view_source == "json":
-            return JsonViewGenerator(
+            self._generator = JsonViewGenerator(
                 portfolio_name=self.portfolio_name,
                 view_file=self.view_file,
             )
+        else:
+            self._generator = StrategyFactory.get_generator(
+                self.view_source,
+                portfolio_name=self.portfolio_name,
+                api_key=self.api_key,
+                history_data=history,
+            )
+        return self._generator
+
+    def prepare(
+        self, prices: pd.DataFrame, rebalance_dates: pd.DatetimeIndex
+    ) -> None:
+        """Prefetch LLM views for every rebalance date in one batch.
+
+        Each LLM call is dominated by fixed network and queueing latency, so
+        the per-date price snapshots are submitted together and scored
+        concurrently.  ``rebalance`` then reads the cached views.  Other
+        view sources are cheap and stay on the live path.
+        """
+        if self.view_source != "llm" or self._degraded or len(rebalance_dates) == 0:
+            return
 
-        return StrategyFactory.get_generator(
-            self.view_source,
-            portfolio_name=self.portfolio_name,
-            api_key=self.api_key,
-            history_data=history,
+        try:
+            generator = self._get_generator(prices)
+            snapshots = [prices.loc[d] for d in rebalance_dates]
+            batched = generator.generate_views_batch(snapshots)
+        except Exception as e:
+            logger.warning(f"[{self.name}] View prefetch failed: {e}")
+            return
+
+        self._views_cache = dict(zip(rebalance_dates, batched))
+        logger.info(
+            f"[{self.name}] Prefetched views for {len(batched)} rebalance dates."
         )
 
-    def rebalance(self, history: pd.DataFrame, **kwargs) -> Dict[str, float]:
+    def _rebalance_impl(
+        self, history: pd.DataFrame, **kwargs
+    ) -> Dict[str, float]:
         # Lazily initialise equal mock market-caps on first call.
         if self.mock_caps is None:
             self.mock_caps = {t: 1e12 for t in history.columns}
 
-        try:
+        views = [] if self._degraded else self._views_cache.get(history.index[-1])
+        if views is None:
             generator = self._get_generator(history)
             views = generator.generate_views(history.iloc[-1])
 
-            engine = BlackLittermanEngine(prices=history)
-            raw_res = engine.run_optimization(
-                market_caps=self.mock_caps, views=views
-            )
-            return self._apply_risk_or_pass(raw_res)
-
-        except Exception as e:
-            logger.warning(f"[{self.name}] Optimization failed: {e}")
-            return {}
\ No newline at end of file
+        engine = BlackLittermanEngine(prices=history)
+        raw_res = engine.run_optimization(
+            market_caps=self.mock_caps, views=views
+        )
+        return self._apply_risk_or_pass(raw_res)
\ No newline at end of file
@@ -6,7 +6,9 @@ Provides two standalone functions that mirror the canonical BL derivation
 from He & Litterman (1999):
   1. ``compute_market_implied_prior`` — equilibrium returns (Pi).
   2. ``compute_posterior`` — posterior distribution after incorporating
-     investor views via the master formula.
+     investor views via the master formula.  Its array core,
+     ``compute_posterior_ndarray``, is exposed for callers that already
+     hold raw ndarrays.
 
 These are kept separate from the PyPortfolioOpt-based engine so they can
 be used for unit testing, research notebooks, or alternative optimization
@@ -17,6 +19,12 @@ import pandas as pd
 from typing import List, Optional, Tuple
 
 from loguru import logger
+from scipy.linalg import cho_factor, cho_solve
+
+# Condition number above which the K × K view system is ridge-regularized,
+# and the ridge size relative to its mean diagonal.
+_MAX_CONDITION = 1e10
+_RIDGE_SCALE = 1e-8
 
 
 def compute_market_implied_prior(
@@ -38,80 +46,90 @@ def compute_market_implied_prior(
     Returns:
         Series of implied excess returns indexed by ticker.
     """
-    # Normalize market caps to portfolio weights.
-    w_mkt = market_caps / market_caps.sum()
-
-    # Align weight ordering with the covariance matrix.
-    w_mkt = w_mkt.reindex(cov_matrix.index).fillna(0)
+    # Align caps with the covariance ordering, then normalize to weights.
+    # The normalizer is the total of *all* caps, as before alignment.
+    w_mkt = (
+        market_caps.reindex(cov_matrix.index).fillna(0).to_numpy(dtype=np.float64)
+        / market_caps.sum()
+    )
 
-    prior = risk_aversion * cov_matrix.dot(w_mkt)
-    return prior + risk_free_rate
+    prior = risk_aversion * (cov_matrix.to_numpy(dtype=np.float64) @ w_mkt)
+    return pd.Series(prior + risk_free_rate, index=cov_matrix.index)
 
 
-def compute_posterior(
-    cov_matrix: pd.DataFrame,
-    prior_returns: pd.Series,
+def compute_posterior_ndarray(
+    Sigma: np.ndarray,
+    Pi: np.ndarray,
     P: np.ndarray,
     Q: np.ndarray,
     tau: float,
     confidences: Optional[List[float]] = None,
-) -> Tuple[pd.Series, pd.DataFrame]:
-    """Compute the posterior return distribution (BL master formula).
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Array core of :func:`compute_posterior`.
 
-    Combines the market prior with K investor views to produce updated
-    expected returns and a posterior covariance matrix.
+    Takes and returns plain ndarrays so callers that already work on raw
+    arrays skip the pandas extraction and re-wrapping.
 
     Args:
-        cov_matrix: N × N covariance matrix (Sigma).
-        prior_returns: N × 1 market-implied returns (Pi).
-        P: K × N view-picking matrix (each row selects assets for one view).
-        Q: K × 1 vector of expected view returns.
+        Sigma: N × N covariance matrix.
+        Pi: N-element prior returns.
+        P: K × N view-picking matrix.
+        Q: K-element expected view returns.
         tau: Scalar uncertainty parameter on the prior covariance.
-        confidences: K × 1 view confidences in [0, 1].  When provided,
-                     each view's variance in Omega is scaled by ``1 / c``
-                     so that higher confidence => tighter uncertainty.
+        confidences: K view confidences in [0, 1]; see
+                     :func:`compute_posterior`.
 
     Returns:
-        A tuple of (posterior_mu, posterior_sigma):
-          - ``posterior_mu``: Series of posterior expected returns.
-          - ``posterior_sigma``: DataFrame of the posterior covariance.
+        A tuple of (N-element posterior mean, N × N posterior covariance).
 
     Raises:
         ValueError: If a singular matrix is encountered during inversion.
     """
-    Sigma = cov_matrix.values
-    Pi = prior_returns.values.reshape(-1, 1)
+    Pi = Pi.reshape(-1, 1)
     Q = Q.reshape(-1, 1)
 
     tau_Sigma = tau * Sigma
 
     # View-implied variance: diag(P @ tau*Sigma @ P^T).
-    P_tau_Sigma_PT = P @ tau_Sigma @ P.T
+    tau_Sigma_PT = tau_Sigma @ P.T
+    P_tau_Sigma_PT = P @ tau_Sigma_PT
     view_variances = np.diag(P_tau_Sigma_PT)
 
-    # Build Omega (view uncertainty matrix).
+    # Build Omega (view uncertainty matrix), kept as its diagonal.
     # Omega_ii = view_variance / confidence — high confidence shrinks
     # uncertainty, low confidence inflates it toward infinity.
     if confidences:
         adj_factors = np.array(
             [1.0 / c if c > 0 else 1e6 for c in confidences]
         )
-        Omega = np.diag(view_variances * adj_factors)
+        omega_diag = view_variances * adj_factors
     else:
-        Omega = np.diag(view_variances)
+        omega_diag = view_variances
 
     # Master formula:
     #   E[R] = M^{-1} @ [(tau*Sigma)^{-1} Pi + P^T Omega^{-1} Q]
     #   where M = (tau*Sigma)^{-1} + P^T Omega^{-1} P
+    # By the Woodbury identity this equals
+    #   E[R]   = Pi + tau*Sigma P^T A^{-1} (Q - P Pi)
+    #   M^{-1} = tau*Sigma - tau*Sigma P^T A^{-1} P tau*Sigma
+    #   where A = P tau*Sigma P^T + Omega
+    # so only the K × K matrix A (K views ≪ N assets) is factored.
     try:
-        inv_tau_Sigma = np.linalg.inv(tau_Sigma)
-        inv_Omega = np.linalg.inv(Omega)
+        if np.any(omega_diag == 0):
+            raise np.linalg.LinAlgError("Omega has a zero view variance")
+
+        A = P_tau_Sigma_PT + np.diag(omega_diag)
+
+        # Near-duplicate views make A ill-conditioned.  A tiny ridge
+        # (identity shrinkage scaled to A's average variance) keeps the
+        # factorization stable instead of failing into the error path.
+        if np.linalg.cond(A) > _MAX_CONDITION:
+            A[np.diag_indices_from(A)] += _RIDGE_SCALE * np.trace(A) / len(A)
 
-        M = inv_tau_Sigma + P.T @ inv_Omega @ P
-        rhs = inv_tau_Sigma @ Pi + P.T @ inv_Omega @ Q
+        A_factor = cho_factor(A)
 
-        inv_M = np.linalg.inv(M)
-        posterior_mu = inv_M @ rhs
+        posterior_mu = Pi + tau_Sigma_PT @ cho_solve(A_factor, Q - P @ Pi)
+        inv_M = tau_Sigma - tau_Sigma_PT @ cho_solve(A_factor, tau_Sigma_PT.T)
 
         # Posterior covariance includes both the original risk and the
         # residual estimation uncertainty.
@@ -123,11 +141,54 @@ def compute_posterior(
             "Singular matrix encountered in BL posterior calculation."
         ) from e
 
-    mu_series = pd.Series(posterior_mu.flatten(), index=cov_matrix.index)
+    return posterior_mu.ravel(), posterior_sigma
+
+
+def compute_posterior(
+    cov_matrix: pd.DataFrame,
+    prior_returns: pd.Series,
+    P: np.ndarray,
+    Q: np.ndarray,
+    tau: float,
+    confidences: Optional[List[float]] = None,
+) -> Tuple[pd.Series, pd.DataFrame]:
+    """Compute the posterior return distribution (BL master formula).
+
+    Combines the market prior with K investor views to produce updated
+    expected returns and a posterior covariance matrix.  Thin pandas
+    wrapper around :func:`compute_posterior_ndarray`.
+
+    Args:
+        cov_matrix: N × N covariance matrix (Sigma).
+        prior_returns: N × 1 market-implied returns (Pi).
+        P: K × N view-picking matrix (each row selects assets for one view).
+        Q: K × 1 vector of expected view returns.
+        tau: Scalar uncertainty parameter on the prior covariance.
+        confidences: K × 1 view confidences in [0, 1].  When provided,
+                     each view's variance in Omega is scaled by ``1 / c``
+                     so that higher confidence => tighter uncertainty.
+
+    Returns:
+        A tuple of (posterior_mu, posterior_sigma):
+          - ``posterior_mu``: Series of posterior expected returns.
+          - ``posterior_sigma``: DataFrame of the posterior covariance.
+
+    Raises:
+        ValueError: If a singular matrix is encountered during inversion.
+    """
+    labels = cov_matrix.index
+    posterior_mu, posterior_sigma = compute_posterior_ndarray(
+        cov_matrix.to_numpy(),
+        prior_returns.to_numpy(),
+        P,
+        Q,
+        tau,
+        confidences,
+    )
+
+    mu_series = pd.Series(posterior_mu, index=labels)
     sigma_df = pd.DataFrame(
-        posterior_sigma,
-        index=cov_matrix.index,
-        columns=cov_matrix.columns,
+        posterior_sigma, index=labels, columns=cov_matrix.columns,
     )
 
-    return mu_series, sigma_df
\ No newline at end of file
+    return mu_series, sigma_df
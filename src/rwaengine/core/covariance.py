@@ -0,0 +1,125 @@
+"""
+Shared Ledoit-Wolf covariance estimation.
+
+Both the Black-Litterman engine and the Markowitz strategy shrink the
+sample covariance of the same price window.  In a walk-forward backtest
+every strategy is handed the identical lookback slice at each rebalance
+date, so the estimate is memoized per window and computed once per date
+instead of once per strategy.
+
+A window is fingerprinted by its columns, first/last dates, length and a
+hash of the raw price buffer.  Hashing is linear in the window size, far
+cheaper than the shrinkage estimate itself, and guarantees that a window
+with the same dates but different prices never reuses a stale matrix.
+
+Strategies rebalanced on a thread pool reach the same window at the same
+moment.  The first caller computes the estimate; concurrent callers for
+the same window wait for its result instead of repeating the work.
+
+The estimate itself calls scikit-learn's ``ledoit_wolf`` on a NumPy
+return matrix.  This is the same estimator PyPortfolioOpt's
+``CovarianceShrinkage(...).ledoit_wolf()`` wraps, without its extra
+sample-covariance pass, DataFrame round trips and PSD repair.  A
+Ledoit-Wolf estimate is a convex blend of the sample covariance and a
+scaled identity, so it is positive semi-definite by construction.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sklearn.covariance import ledoit_wolf
+
+TRADING_DAYS = 252
+
+_CACHE_SIZE = 32
+_cache: "OrderedDict[Tuple[Hashable, ...], pd.DataFrame]" = OrderedDict()
+# Windows currently being estimated; set once the result is cached.
+_pending: Dict[Tuple[Hashable, ...], threading.Event] = {}
+_lock = threading.Lock()
+
+
+def _fingerprint(prices: pd.DataFrame) -> Tuple[Hashable, ...]:
+    """Cheap identity for a price window (see module docstring)."""
+    values = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+    return (
+        tuple(prices.columns),
+        prices.index[0] if len(prices) else None,
+        prices.index[-1] if len(prices) else None,
+        len(prices),
+        hash(values.tobytes()),
+    )
+
+
+def simple_returns(prices: pd.DataFrame) -> pd.DataFrame:
+    """Daily simple returns of *prices*.
+
+    Follows PyPortfolioOpt's ``returns_from_prices``: rows where every
+    ticker is NaN are dropped and other NaNs are kept.  The result can be
+    handed to PyPortfolioOpt with ``returns_data=True``.
+    """
+    values = prices.to_numpy(dtype=np.float64)
+    rets = values[1:] / values[:-1] - 1.0
+    keep = ~np.isnan(rets).all(axis=1)
+    return pd.DataFrame(
+        rets[keep], index=prices.index[1:][keep], columns=prices.columns,
+    )
+
+
+def ledoit_wolf_covariance(
+    prices: pd.DataFrame,
+    returns: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Annualized Ledoit-Wolf covariance of *prices*, memoized per window.
+
+    Args:
+        prices: Wide-format DataFrame of adjusted-close prices
+                (DatetimeIndex × tickers).
+        returns: ``simple_returns(prices)`` if the caller already has it;
+                 computed here otherwise.
+
+    Returns:
+        N × N covariance DataFrame indexed by ticker.  Each call returns its
+        own copy, so callers may modify it freely.
+    """
+    key = _fingerprint(prices)
+
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached.copy()
+
+        pending = _pending.get(key)
+        if pending is None:
+            _pending[key] = threading.Event()
+
+    if pending is not None:
+        # Another thread is estimating this window; reuse its result.  If it
+        # failed (or the entry was already evicted) the retry computes it.
+        pending.wait()
+        return ledoit_wolf_covariance(prices, returns)
+
+    try:
+        logger.info("Computing covariance matrix (Ledoit-Wolf)...")
+        if returns is None:
+            returns = simple_returns(prices)
+
+        # Same cleaning as PyPortfolioOpt: remaining NaNs count as zero.
+        shrunk, _ = ledoit_wolf(np.nan_to_num(returns.to_numpy(dtype=np.float64)))
+        cov = pd.DataFrame(
+            shrunk * TRADING_DAYS, index=prices.columns, columns=prices.columns,
+        )
+
+        with _lock:
+            _cache[key] = cov
+            _cache.move_to_end(key)
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    finally:
+        with _lock:
+            _pending.pop(key).set()
+
+    return cov.copy()
@@ -13,11 +13,12 @@ rather than producing unreliable risk-asset weights.
 """
 import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from loguru import logger
-from pypfopt import black_litterman, efficient_frontier, risk_models
 
+from src.rwaengine.core.covariance import ledoit_wolf_covariance
+from src.rwaengine.core.optimization import max_sharpe
 from src.rwaengine.strategy.types import (
     InvestorView,
     OptimizationResult,
@@ -32,20 +33,30 @@ class BlackLittermanEngine:
         self,
         prices: pd.DataFrame,
         config: StrategyConfig = StrategyConfig(),
+        cov_matrix: Optional[pd.DataFrame] = None,
     ):
         """
         Args:
             prices: Wide-format DataFrame of adjusted-close prices
                     (DatetimeIndex × tickers).
             config: Strategy hyperparameters (risk aversion, tau).
+            cov_matrix: Precomputed annualized covariance aligned with
+                        *prices*.  Skips the shrinkage estimate entirely.
         """
         self.prices = prices
         self.config = config
 
         # Pre-compute the covariance matrix using the Ledoit-Wolf shrinkage
-        # estimator for improved numerical stability.
-        logger.info("Computing covariance matrix (Ledoit-Wolf)...")
-        self.S = risk_models.CovarianceShrinkage(self.prices).ledoit_wolf()
+        # estimator for improved numerical stability.  The estimate is shared
+        # with any other strategy that sees the same price window.
+        if cov_matrix is not None:
+            self.S = cov_matrix
+        else:
+            self.S = ledoit_wolf_covariance(self.prices)
+
+        # Raw covariance buffer for the prior's matrix-vector product, so it
+        # skips pandas label alignment on every call.
+        self._S_values = np.ascontiguousarray(self.S.to_numpy(dtype=np.float64))
 
     def run_optimization(
         self,
@@ -67,26 +78,30 @@ class BlackLittermanEngine:
 
         logger.info("Calculating market-implied prior returns...")
 
-        mcaps = pd.Series(market_caps).reindex(tickers)
+        # Gather caps in ticker order straight into an array; unknown
+        # tickers become NaN.
+        caps = np.fromiter(
+            (market_caps.get(t, np.nan) for t in tickers),
+            dtype=np.float64,
+            count=len(tickers),
+        )
 
         # Fill missing market caps with the mean so the pipeline doesn't
-        # crash.  In production this should raise instead.
-        if mcaps.isnull().any():
-            missing = mcaps[mcaps.isnull()].index.tolist()
+        # crash.  In production this should raise instead.  A single NaN
+        # scan on the raw array; complete caps skip the fill entirely.
+        nan_mask = np.isnan(caps)
+        if nan_mask.any():
+            missing = [t for t, m in zip(tickers, nan_mask) if m]
             logger.warning(f"Missing market caps for {missing}. Filling with mean.")
-            mcaps = mcaps.fillna(mcaps.mean())
+            caps = np.where(nan_mask, np.nanmean(caps), caps)
 
         delta = self.config.risk_aversion
         logger.info(f"Risk aversion (delta): {delta:.4f}")
 
-        market_prior = black_litterman.market_implied_prior_returns(
-            market_caps=mcaps,
-            risk_aversion=delta,
-            cov_matrix=self.S,
-            risk_free_rate=0.04,
-        )
+        market_prior = self._market_prior(caps, delta)
 
-        # Without views, optimization uses the equilibrium prior directly.
+        # Without views there is no Bayesian update: the equilibrium prior
+        # and the sample covariance go straight to the optimizer.
         if not views:
             logger.warning("No views provided — using market prior only.")
             posterior_rets = market_prior
@@ -96,6 +111,9 @@ class BlackLittermanEngine:
 
             Q, P, view_confidences = self._parse_views(views, tickers)
 
+            # Imported here so view-less runs never load PyPortfolioOpt.
+            from pypfopt import black_litterman
+
             bl = black_litterman.BlackLittermanModel(
                 cov_matrix=self.S,
                 pi=market_prior,
@@ -116,12 +134,10 @@ class BlackLittermanEngine:
         # is handled downstream by the risk-management module.
         logger.info("Optimizing portfolio weights (max Sharpe)...")
 
-        ef = efficient_frontier.EfficientFrontier(posterior_rets, posterior_cov)
-
         try:
-            ef.max_sharpe(risk_free_rate=0.04)
-            cleaned_weights = ef.clean_weights()
-            perf = ef.portfolio_performance(verbose=False, risk_free_rate=0.04)
+            cleaned_weights, perf = max_sharpe(
+                posterior_rets, posterior_cov, risk_free_rate=0.04,
+            )
         except Exception as e:
             logger.error(f"Optimization failed: {e}. Falling back to cash.")
             return self._fallback_result(tickers)
@@ -134,6 +150,19 @@ class BlackLittermanEngine:
             sharpe_ratio=perf[2],
         )
 
+    def _market_prior(self, caps: np.ndarray, delta: float) -> pd.Series:
+        """Market-implied prior returns.
+
+        Computes ``delta * Sigma @ w_mkt + r_f`` as one matrix-vector product
+        on the raw covariance, which is what PyPortfolioOpt's
+        ``market_implied_prior_returns`` evaluates through pandas.  *caps*
+        must already be aligned with the covariance ordering.
+        """
+        w_mkt = caps / caps.sum()
+        return pd.Series(
+            delta * (self._S_values @ w_mkt) + 0.04, index=self.S.index,
+        )
+
     def _parse_views(
         self,
         views: List[InvestorView],
@@ -150,24 +179,32 @@ class BlackLittermanEngine:
         n_views = len(views)
         n_assets = len(tickers)
 
-        P = np.zeros((n_views, n_assets))
-        Q = np.zeros(n_views)
-        confidences = []
+        Q = np.fromiter(
+            (view.expected_return for view in views), dtype=np.float64, count=n_views,
+        )
+        confidences = [view.confidence for view in views]
 
-        # Build a ticker → column-index lookup for fast P-matrix population.
+        # Build a ticker → column-index lookup, then flatten every
+        # (view, asset, weight) triple and scatter them into P in one go.
         mapper = {t: idx for idx, t in enumerate(tickers)}
+        assets = [a for view in views for a in view.assets]
 
-        for i, view in enumerate(views):
-            Q[i] = view.expected_return
-            confidences.append(view.confidence)
-
-            for asset, weight in zip(view.assets, view.weights):
-                if asset in mapper:
-                    P[i, mapper[asset]] = weight
-                else:
-                    logger.error(
-                        f"Asset '{asset}' in view not found in market data."
-                    )
+        rows = np.repeat(np.arange(n_views), [len(view.assets) for view in views])
+        cols = np.fromiter(
+            (mapper.get(a, -1) for a in assets), dtype=np.intp, count=len(assets),
+        )
+        data = np.fromiter(
+            (w for view in views for w in view.weights),
+            dtype=np.float64, count=len(assets),
+        )
+
+        known = cols >= 0
+        for asset, ok in zip(assets, known):
+            if not ok:
+                logger.error(f"Asset '{asset}' in view not found in market data.")
+
+        P = np.zeros((n_views, n_assets))
+        P[rows[known], cols[known]] = data[known]
 
         return Q, P, confidences
 
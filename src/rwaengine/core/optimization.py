@@ -0,0 +1,97 @@
+"""
+Max-Sharpe portfolio optimisation.
+
+For a long-only, fully-invested portfolio the maximum-Sharpe (tangency)
+weights are ``w ∝ Sigma^{-1} (mu - r_f)`` whenever that vector has no
+negative entries: the unconstrained optimum is then feasible and
+therefore also the constrained one.  That closed form is one Cholesky
+solve, so it is tried first; only when it would short an asset do we hand
+the problem to PyPortfolioOpt's ``EfficientFrontier.max_sharpe`` solver.
+
+Both paths clean the raw weight vector with the same vectorized rule as
+``EfficientFrontier.clean_weights`` (zero below 1e-4, round to five
+places), so they return identically formatted allocations.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+# (expected return, volatility, Sharpe ratio)
+Performance = Tuple[float, float, float]
+
+
+def _clean(weights: np.ndarray, cutoff: float = 1e-4, rounding: int = 5) -> np.ndarray:
+    """Zero out dust positions and round, as ``clean_weights`` does."""
+    weights = np.where(np.abs(weights) < cutoff, 0.0, weights)
+    return np.round(weights, rounding)
+
+
+def tangency_weights(
+    mu: pd.Series,
+    cov: pd.DataFrame,
+    risk_free_rate: float = 0.04,
+) -> Optional[np.ndarray]:
+    """Closed-form long-only tangency portfolio, if it exists.
+
+    Args:
+        mu: Expected annual returns indexed by ticker.
+        cov: Annualized covariance matrix aligned with *mu*.
+        risk_free_rate: Annual risk-free rate.
+
+    Returns:
+        Weights summing to one, or ``None`` when the unconstrained optimum
+        would short an asset, has no positive excess return, or *cov* is not
+        positive definite.
+    """
+    excess = mu.to_numpy(dtype=np.float64) - risk_free_rate
+    try:
+        raw = cho_solve(cho_factor(cov.to_numpy(dtype=np.float64)), excess)
+    except LinAlgError:
+        return None
+
+    total = raw.sum()
+    if not np.isfinite(total) or total <= 0 or (raw < 0).any():
+        return None
+    return raw / total
+
+
+def max_sharpe(
+    mu: pd.Series,
+    cov: pd.DataFrame,
+    risk_free_rate: float = 0.04,
+) -> Tuple[Dict[str, float], Performance]:
+    """Long-only maximum-Sharpe weights and their performance.
+
+    Args:
+        mu: Expected annual returns indexed by ticker.
+        cov: Annualized covariance matrix aligned with *mu*.
+        risk_free_rate: Annual risk-free rate.
+
+    Returns:
+        A tuple of (cleaned ticker → weight mapping, performance), where
+        performance is (expected return, volatility, Sharpe ratio).
+
+    Raises:
+        Whatever ``EfficientFrontier.max_sharpe`` raises when the closed
+        form does not apply and the solver fails.
+    """
+    weights = tangency_weights(mu, cov, risk_free_rate)
+
+    if weights is None:
+        # Imported here: the solver stack (cvxpy) is only needed when the
+        # closed form does not apply.
+        from pypfopt import EfficientFrontier
+
+        ef = EfficientFrontier(mu, cov)
+        ef.max_sharpe(risk_free_rate=risk_free_rate)
+        perf = ef.portfolio_performance(verbose=False, risk_free_rate=risk_free_rate)
+        weights = ef.weights
+    else:
+        sigma = cov.to_numpy(dtype=np.float64)
+        ret = float(weights @ mu.to_numpy(dtype=np.float64))
+        vol = float(np.sqrt(weights @ sigma @ weights))
+        perf = (ret, vol, (ret - risk_free_rate) / vol)
+
+    return dict(zip(mu.index, _clean(weights).tolist())), perf
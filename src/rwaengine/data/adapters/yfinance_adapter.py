@@ -8,25 +8,63 @@ different yfinance versions (column ordering, MultiIndex layouts, renamed
 long-format DataFrame.
 """
 from datetime import date
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import pandas as pd
-import yfinance as yf
 from loguru import logger
 
 from src.rwaengine.data.base import MarketDataProvider
 
 
+# Raw yfinance field names (lowercased) used to detect the price level.
+_PRICE_FIELDS = {"open", "high", "low", "close", "adj close", "volume"}
+
+# Spellings of the adjusted-close column seen across yfinance versions.
+_ADJ_CLOSE_CANDIDATES = ("adj close", "adj_close", "adjclose", "adjusted close")
+
+_COLUMN_MAP = {
+    "open": "open_price",
+    "high": "high_price",
+    "low": "low_price",
+    "close": "close_price",
+}
+
+# Lowercased raw header -> internal column name, resolved in one pass.
+_RENAME_MAP = {
+    **{candidate: "adj_close" for candidate in _ADJ_CLOSE_CANDIDATES},
+    **_COLUMN_MAP,
+}
+
+# Placeholder ticker for single-asset downloads that carry no ticker level.
+_UNKNOWN_TICKER = "UNKNOWN"
+
+
 class YFinanceAdapter(MarketDataProvider):
     """Concrete MarketDataProvider backed by Yahoo Finance."""
 
-    def __init__(self, proxy: Optional[str] = None):
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        session: Optional[Any] = None,
+        max_threads: Optional[int] = None,
+    ):
         """
         Args:
             proxy: Optional HTTP/SOCKS proxy URL for regions with restricted
                    access to Yahoo Finance (e.g. mainland China, Macau).
+            session: Optional HTTP session handed to ``yf.download`` so that
+                     long-running processes reuse pooled keep-alive
+                     connections across fetches.  Must be a session type
+                     the installed yfinance accepts (``curl_cffi`` for
+                     recent releases).  When omitted yfinance manages its
+                     own session.
+            max_threads: Cap on yfinance's concurrent per-ticker requests,
+                         e.g. to stay under Yahoo's rate limits.  When
+                         omitted yfinance picks its own default.
         """
         self.proxy = proxy
+        self.session = session
+        self.max_threads = max_threads
 
     def fetch_history(
         self,
@@ -63,6 +101,9 @@ class YFinanceAdapter(MarketDataProvider):
                 )
                 return pd.DataFrame()
 
+            # Imported here so cache hits never pay yfinance's import cost.
+            import yfinance as yf
+
             df = yf.download(
                 tickers,
                 start=start_date,
@@ -70,8 +111,9 @@ class YFinanceAdapter(MarketDataProvider):
                 auto_adjust=False,   # Keep raw Close AND Adj Close (both needed for RWA NAV vs strategy returns)
                 actions=False,       # Exclude dividend / split events for now
                 progress=False,
-                threads=True,
+                threads=self.max_threads or True,
                 group_by="ticker",   # Request (Ticker, Price) MultiIndex for multi-asset downloads
+                **({"session": self.session} if self.session is not None else {}),
             )
 
             # Guard against empty responses (weekends, holidays, delisted tickers).
@@ -84,6 +126,9 @@ class YFinanceAdapter(MarketDataProvider):
 
             df_clean = self._standardize_columns(df)
 
+            if len(tickers) == 1:
+                df_clean["ticker"] = tickers[0]
+
             # Post-cleaning guard: the standardization logic may legitimately
             # discard all rows if critical columns are absent.
             if df_clean.empty:
@@ -117,9 +162,57 @@ class YFinanceAdapter(MarketDataProvider):
             internal naming convention, or an empty DataFrame if required
             price columns are missing.
         """
-        data = df.copy()
-
         # Protect against zombie DataFrames that have an index but no columns.
-        if len(data.columns) == 0:
+        if len(df.columns) == 0:
+            return pd.DataFrame()
+
+        # Both branches build a fresh frame before anything is mutated, so the
+        # caller's download is never modified and never copied up front.
+        if isinstance(df.columns, pd.MultiIndex):
+            # Whichever level carries the OHLCV field names is the "Price"
+            # level; the other one holds the tickers.
+            level0 = {str(c).lower() for c in df.columns.get_level_values(0)}
+            ticker_level = 1 if level0 & _PRICE_FIELDS else 0
+
+            # One (dates × fields) block per ticker, concatenated once.  This
+            # avoids the general-purpose stack reshape and its intermediate
+            # MultiIndex frames; rows come out grouped by ticker, which no
+            # consumer depends on.
+            tickers = df.columns.get_level_values(ticker_level).unique()
+            data = (
+                pd.concat(
+                    [df.xs(tk, axis=1, level=ticker_level) for tk in tickers],
+                    keys=tickers,
+                )
+                .rename_axis(["ticker", "trade_date"])
+                .reset_index()
+            )
+        else:
+            # Single-ticker download: no ticker level to unpack.
+            data = df.rename_axis("trade_date").reset_index()
+            data["ticker"] = _UNKNOWN_TICKER
+
+        # Normalise and map the headers in place ('Adj Close' has been spelled
+        # several ways across yfinance releases).  Assigning the index avoids
+        # the full-frame copies that chained rename() calls would make.
+        headers = data.columns.astype(str).str.lower().str.strip()
+        data.columns = [_RENAME_MAP.get(c, c) for c in headers]
+
+        required = ["open_price", "high_price", "low_price", "close_price", "volume"]
+        missing = [c for c in required if c not in data.columns]
+        if missing:
+            logger.error(f"Required price columns missing after standardization: {missing}")
             return pd.DataFrame()
 
+        # Fall back to the raw close when no adjusted series is provided
+        # (e.g. indices such as ^VIX under some yfinance versions).
+        if "adj_close" not in data.columns:
+            data["adj_close"] = data["close_price"]
+
+        # The stacked frame holds a row for every (date, ticker) pair, including
+        # days on which a given ticker did not trade.
+        data = data.dropna(subset=["close_price"])
+
+        columns = ["trade_date", "ticker", *required, "adj_close"]
+        return data[columns].reset_index(drop=True)
+
@@ -41,11 +41,13 @@ class MarketDataProvider(ABC):
         """
 
     def validate_schema(self, df: pd.DataFrame) -> bool:
-        """Verify that the DataFrame contains every column the engine expects.
+        """Verify the DataFrame's columns and row values against MarketData.
 
         This is a defence-in-depth check: even if the adapter's own
         transformation logic ran without errors, we still confirm the output
-        schema before handing data to downstream consumers.
+        schema before handing data to downstream consumers.  Row-level rules
+        are checked for the whole frame at once by
+        ``MarketData.validate_frame``.
 
         Args:
             df: The adapter-produced DataFrame to validate.
@@ -54,7 +56,8 @@ class MarketDataProvider(ABC):
             ``True`` if validation passes.
 
         Raises:
-            ValueError: If one or more required columns are missing.
+            ValueError: If one or more required columns are missing, or a
+                        row violates the MarketData constraints.
         """
         required_cols = {
             "open_price",
@@ -75,4 +78,10 @@ class MarketDataProvider(ABC):
                 f"DataFrame violates MarketData schema. Missing: {missing}"
             )
 
-        return True
\ No newline at end of file
+        try:
+            MarketData.validate_frame(df)
+        except ValueError as e:
+            logger.critical(f"Data schema violation! {e}")
+            raise
+
+        return True
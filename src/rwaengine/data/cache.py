@@ -0,0 +1,107 @@
+"""
+On-disk cache for market data providers.
+
+Wraps any concrete ``MarketDataProvider`` and memoizes ``fetch_history``
+results under a local cache directory, keyed on the requested tickers and
+date window.  Re-running the same portfolio during iterative development
+then reads a local pickle instead of hitting the network again.
+
+Pickle is used rather than parquet/HDF so the cache works with the core
+dependency set (no pyarrow / PyTables required).
+"""
+import hashlib
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import List, Union
+
+import pandas as pd
+from loguru import logger
+
+from src.rwaengine.data.base import MarketDataProvider
+
+
+DEFAULT_CACHE_DIR = Path(".cache") / "yf"
+
+
+class CachedMarketDataProvider(MarketDataProvider):
+    """Disk-memoizing decorator around another MarketDataProvider."""
+
+    def __init__(
+        self,
+        provider: MarketDataProvider,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+    ):
+        """
+        Args:
+            provider: The underlying adapter that performs the real download.
+            cache_dir: Directory where cached frames are stored.  Created on
+                       first write.
+        """
+        self.provider = provider
+        self.cache_dir = Path(cache_dir)
+
+    def cache_key(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> str:
+        """Build a stable cache key for a fetch request.
+
+        Tickers are sorted so that the key does not depend on the order in
+        which the caller assembled the list.
+        """
+        payload = json.dumps(
+            [
+                type(self.provider).__name__,
+                sorted(tickers),
+                str(start_date),
+                str(end_date),
+            ]
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def fetch_history(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """Return cached history if available, otherwise fetch and store it.
+
+        Args:
+            tickers: Ticker symbols to fetch.
+            start_date: First calendar date of the window.
+            end_date: Last calendar date of the window.
+
+        Returns:
+            The standardized long-format DataFrame produced by the wrapped
+            provider.
+        """
+        path = self.cache_dir / f"{self.cache_key(tickers, start_date, end_date)}.pkl"
+
+        if path.exists():
+            try:
+                df = pd.read_pickle(path)
+                logger.info(f"Loaded {len(df)} cached rows from {path}")
+                return df
+            except Exception as e:
+                # A truncated or incompatible file should never block a run.
+                logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+
+        df = self.provider.fetch_history(tickers, start_date, end_date)
+
+        # Empty frames usually mean a transient outage; don't persist them.
+        if not df.empty:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                df.to_pickle(tmp_path)
+                os.replace(tmp_path, path)
+                logger.debug(f"Cached market data to {path}")
+            except OSError as e:
+                logger.warning(f"Failed to write cache file {path}: {e}")
+
+        return df
@@ -10,8 +10,12 @@ the boundary — before anything reaches the core engine.
 from datetime import date
 from typing import Optional
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field, field_validator
 
+_PRICE_COLUMNS = ["open_price", "high_price", "low_price", "close_price"]
+
 
 class MarketData(BaseModel):
     """Validated OHLCV record for a single ticker on a single trading day."""
@@ -40,4 +44,45 @@ class MarketData(BaseModel):
             raise ValueError(
                 f"High price ({v}) is below low price ({values['low_price']})"
             )
-        return v
\ No newline at end of file
+        return v
+
+    @classmethod
+    def validate_frame(cls, df: pd.DataFrame) -> None:
+        """Check every row of a long-format frame against this model's rules.
+
+        Applies the same invariants as the field constraints above — strictly
+        positive prices, ``high >= low``, non-negative volume and a positive
+        ``adj_close`` where one is present — as whole-column boolean masks
+        instead of building one model instance per row.  As with the model,
+        a missing (NaN) price fails the positivity check.
+
+        Args:
+            df: Standardized adapter output containing the OHLCV columns.
+
+        Raises:
+            ValueError: On the first rule violated, naming the offending row.
+        """
+        prices = df[_PRICE_COLUMNS].to_numpy(dtype=np.float64)
+        high = prices[:, 1]
+        low = prices[:, 2]
+
+        checks = [
+            ("prices must be strictly positive", (prices > 0).all(axis=1)),
+            ("high price is below low price", high >= low),
+            ("volume must be non-negative", df["volume"].to_numpy(dtype=np.float64) >= 0),
+        ]
+        if "adj_close" in df.columns:
+            adj = df["adj_close"].to_numpy(dtype=np.float64)
+            checks.append(("adj_close must be strictly positive", np.isnan(adj) | (adj > 0)))
+
+        for message, ok in checks:
+            if not ok.all():
+                pos = int(np.flatnonzero(~ok)[0])
+                row = df.iloc[pos]
+                label = ", ".join(
+                    f"{key}={row[key]}" for key in ("ticker", "trade_date") if key in df.columns
+                )
+                raise ValueError(
+                    f"MarketData violation at row {pos} ({label}): {message}. "
+                    f"Row: {row[_PRICE_COLUMNS + ['volume']].to_dict()}"
+                )
@@ -0,0 +1,52 @@
+"""
+Reshaping helpers for standardized market data.
+
+Adapters emit a long-format frame (one row per ticker per day).  The
+optimisers and backtester consume a wide price matrix (dates × tickers).
+The conversion lives here so every entry point reshapes the data the same
+way.
+"""
+import pandas as pd
+
+
+def to_price_matrix(
+    df_market: pd.DataFrame,
+    value_col: str = "adj_close",
+) -> pd.DataFrame:
+    """Convert long-format market data into a clean wide price matrix.
+
+    Uses ``set_index(...).unstack`` instead of ``DataFrame.pivot``.  It
+    selects the single value column before reshaping, so the other OHLCV
+    columns are never carried through the reshape.
+
+    After a forward fill, NaNs can only remain before a column's first
+    observation, so ``dropna()`` reduces to slicing from the latest
+    first-valid row.  That row is located on the boolean mask instead of
+    scanning the filled frame a second time.
+
+    Args:
+        df_market: Standardized adapter output with ``trade_date``,
+                   ``ticker`` and *value_col* columns.
+        value_col: Price column to spread across tickers.
+
+    Returns:
+        A DataFrame indexed by ``trade_date`` with one column per ticker.
+        Gaps are forward-filled and any remaining leading rows with missing
+        values are dropped.
+    """
+    wide = (
+        df_market
+        .set_index(["trade_date", "ticker"])[value_col]
+        .unstack("ticker")
+    )
+    if wide.shape[1] == 0:
+        return wide
+
+    valid = wide.notna().to_numpy()
+
+    # A column with no observations at all would empty the frame under dropna.
+    if not valid.any(axis=0).all():
+        return wide.iloc[0:0]
+
+    start = int(valid.argmax(axis=0).max())
+    return wide.ffill().iloc[start:]
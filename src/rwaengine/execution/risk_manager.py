@@ -12,7 +12,6 @@ execution layer:
      *not* back into other risk assets.
 """
 import numpy as np
-import pandas as pd
 from loguru import logger
 
 from src.rwaengine.strategy.types import OptimizationResult
@@ -34,6 +33,9 @@ class PortfolioRiskManager:
         self.cash_buffer = cash_buffer_pct
         self.max_weight = max_weight_pct
 
+        # Target equity exposure, fixed for the manager's lifetime.
+        self._equity_scale = 1.0 - cash_buffer_pct
+
     def apply_guardrails(
         self, result: OptimizationResult
     ) -> OptimizationResult:
@@ -55,39 +57,42 @@ class PortfolioRiskManager:
         """
         logger.info("Applying risk guardrails...")
 
-        weights = pd.Series(data=result.weights, index=result.tickers)
+        # Plain float64 array throughout; tickers only reappear in the output.
+        weights = np.array(result.weights, dtype=np.float64)
 
         # Remove dust positions.
         weights[weights < 0.01] = 0.0
 
         # Re-normalise so surviving positions sum to 1.
-        if weights.sum() > 0:
-            weights = weights / weights.sum()
+        total = weights.sum()
+        if total > 0:
+            weights /= total
         else:
             logger.warning("All positions filtered as dust — defaulting to 100 % cash.")
 
         # Scale to target equity exposure.
-        target_equity_exposure = 1.0 - self.cash_buffer
-        weights = weights * target_equity_exposure
+        weights *= self._equity_scale
 
         # Apply per-asset hard cap; excess flows to cash, not other assets.
         overweight_mask = weights > self.max_weight
         if overweight_mask.any():
-            capped_tickers = weights[overweight_mask].index.tolist()
-            logger.warning(f"Capping concentrated positions: {capped_tickers}")
-            weights[overweight_mask] = self.max_weight
+            # Lazy: the ticker list is only built if the message is emitted.
+            logger.opt(lazy=True).warning(
+                "Capping concentrated positions: {}",
+                lambda: [result.tickers[i] for i in np.flatnonzero(overweight_mask)],
+            )
+            np.minimum(weights, self.max_weight, out=weights)
 
         # Assign remaining capacity to USDC.
-        final_equity_sum = weights.sum()
+        final_equity_sum = float(weights.sum())
         usdc_weight = max(1.0 - final_equity_sum, 0.0)
-        weights["USDC"] = usdc_weight
 
-        logger.success(f"Risk check passed. USDC liquidity: {usdc_weight:.2%}")
+        logger.success("Risk check passed. USDC liquidity: {:.2%}", usdc_weight)
 
         return OptimizationResult(
-            tickers=weights.index.tolist(),
-            weights=weights.values.tolist(),
+            tickers=[*result.tickers, "USDC"],
+            weights=[*weights.tolist(), usdc_weight],
             expected_return=result.expected_return * final_equity_sum,
             volatility=result.volatility * final_equity_sum,
             sharpe_ratio=result.sharpe_ratio,
-        )
\ No newline at end of file
+        )
@@ -6,18 +6,16 @@ Pydantic-validated payload, signs it with an Ethereum private key using
 EIP-191 personal-sign, and returns the complete signed response ready
 for on-chain submission or local archival.
 """
+import json
 import time
 from typing import Any, Dict
 
+import numpy as np
 from eth_account import Account
 from eth_account.messages import encode_defunct
 from loguru import logger
 
-from src.rwaengine.oracle.schemas import (
-    OraclePayload,
-    PortfolioAllocation,
-    SignedOracleResponse,
-)
+from src.rwaengine.oracle.schemas import OraclePayload, PortfolioAllocation
 
 
 class NAVReporter:
@@ -39,7 +37,11 @@ class NAVReporter:
             private_key = "0x" + private_key
 
         self._account = Account.from_key(private_key)
-        logger.info(f"NAVReporter initialised. Signer: {self._account.address}")
+
+        # Resolved once for logging and the response envelope.
+        self._signer_address = self._account.address
+        self._signer_prefix = self._signer_address[:10]
+        logger.info(f"NAVReporter initialised. Signer: {self._signer_address}")
 
     def generate_payload(
         self,
@@ -61,10 +63,37 @@ class NAVReporter:
         """
         logger.info("Packaging allocation for oracle transmission...")
 
-        # Convert decimal weights to basis-point integers.
+        # Convert decimal weights to basis-point integers in one vectorized
+        # step, rounding to the nearest bp (weights are non-negative).
+        weights = np.fromiter(
+            allocation.values(), dtype=np.float64, count=len(allocation),
+        )
+        bps = (weights * 10_000.0 + 0.5).astype(np.int64)
+
+        # Rounding moves each entry by at most half a bp, so a fully invested
+        # allocation lands well within len(allocation) bps of 10 000.  That
+        # rounding residual is folded into the cash leg so the signed bps sum
+        # to exactly 10 000.  When there is no cash leg, or absorbing a
+        # negative residual would push it below zero, the largest position
+        # takes it instead.  A larger gap means the allocation itself is off
+        # and is only reported.
+        residual = 10_000 - int(bps.sum())
+        if abs(residual) > len(allocation):
+            logger.warning(
+                f"Allocation sums to {10_000 - residual} bps, expected ~10000."
+            )
+        elif residual:
+            tickers = list(allocation)
+            target = int(bps.argmax())
+            if "USDC" in allocation:
+                usdc = tickers.index("USDC")
+                if bps[usdc] + residual >= 0:
+                    target = usdc
+            bps[target] += residual
+
         allocations_list = [
-            PortfolioAllocation(symbol=ticker, weight_bps=int(weight * 10_000))
-            for ticker, weight in allocation.items()
+            PortfolioAllocation(symbol=ticker, weight_bps=b)
+            for ticker, b in zip(allocation, bps.tolist())
         ]
 
         # Build the structured payload.
@@ -82,14 +111,13 @@ class NAVReporter:
         message = encode_defunct(text=payload_json)
         signed_message = self._account.sign_message(message)
 
-        logger.success(
-            f"Payload signed by {self._account.address[:10]}..."
-        )
-
-        response = SignedOracleResponse(
-            data=payload,
-            signature=signed_message.signature.hex(),
-            signer_address=self._account.address,
-        )
+        logger.success("Payload signed by {}...", self._signer_prefix)
 
-        return response.model_dump()
\ No newline at end of file
+        # Same shape as ``SignedOracleResponse.model_dump()``, but ``data`` is
+        # decoded from the exact JSON that was signed instead of having
+        # Pydantic walk the payload a second time.
+        return {
+            "data": json.loads(payload_json),
+            "signature": signed_message.signature.hex(),
+            "signer_address": self._signer_address,
+        }
\ No newline at end of file
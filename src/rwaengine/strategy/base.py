@@ -30,4 +30,21 @@ class ViewGenerator(ABC):
         Returns:
             A list of standardised ``InvestorView`` objects ready for the
             Black-Litterman model.
-        """
\ No newline at end of file
+        """
+
+    def generate_views_batch(
+        self, snapshots: List[pd.Series]
+    ) -> List[List[InvestorView]]:
+        """Produce views for several price snapshots at once.
+
+        The default simply calls :meth:`generate_views` per snapshot.
+        Sources with a high fixed cost per call (remote LLMs) override this
+        to issue the requests concurrently.
+
+        Args:
+            snapshots: Price series (ticker → price), one per request.
+
+        Returns:
+            One list of views per snapshot, in input order.
+        """
+        return [self.generate_views(prices) for prices in snapshots]
@@ -5,15 +5,16 @@ Factory for investor-view generators.
 Maps a strategy mode string (``"json"``, ``"ml"``, ``"llm"``) to the
 concrete ``ViewGenerator`` subclass that produces ``InvestorView`` objects
 for the Black-Litterman model.
+
+Generator modules are imported lazily inside ``get_generator`` so that a
+``json`` run never pays the import cost of XGBoost or the LangChain/Gemini
+stack.
 """
 from typing import Literal
 
 from loguru import logger
 
 from src.rwaengine.strategy.base import ViewGenerator
-from src.rwaengine.strategy.generators.json_loader import JsonViewGenerator
-from src.rwaengine.strategy.generators.llm_agent import GeminiViewGenerator
-from src.rwaengine.strategy.generators.ml_predictor import MLViewGenerator
 
 StrategyMode = Literal["json", "ml", "llm"]
 
@@ -29,7 +30,9 @@ class StrategyFactory:
             mode: One of ``"json"``, ``"ml"``, or ``"llm"``.
             **kwargs: Forwarded to the concrete generator constructor.
                 - *json*: ``portfolio_name`` (str).
-                - *ml*: ``history_data`` (pd.DataFrame).
+                - *ml*: ``history_data`` (pd.DataFrame), optional ``pooled``
+                  (bool), ``n_jobs`` (int)
+                  and ``device`` (str).
                 - *llm*: ``api_key`` (str).
 
         Raises:
@@ -39,6 +42,8 @@ class StrategyFactory:
         logger.info(f"Initializing view generator: mode={mode.upper()}")
 
         if mode == "json":
+            from src.rwaengine.strategy.generators.json_loader import JsonViewGenerator
+
             return JsonViewGenerator(
                 portfolio_name=kwargs.get("portfolio_name", "default"),
             )
@@ -47,12 +52,23 @@ class StrategyFactory:
             history = kwargs.get("history_data")
             if history is None:
                 raise ValueError("ML generator requires 'history_data'")
-            return MLViewGenerator(history_data=history)
+
+            from src.rwaengine.strategy.generators.ml_predictor import MLViewGenerator
+
+            return MLViewGenerator(
+                history_data=history,
+                pooled=kwargs.get("pooled", False),
+                n_jobs=kwargs.get("n_jobs", 1),
+                device=kwargs.get("device", "cpu"),
+            )
 
         if mode == "llm":
             key = kwargs.get("api_key")
             if not key:
                 raise ValueError("LLM generator requires 'api_key'")
+
+            from src.rwaengine.strategy.generators.llm_agent import GeminiViewGenerator
+
             return GeminiViewGenerator(api_key=key)
 
         raise ValueError(f"Unknown strategy mode: {mode}")
\ No newline at end of file
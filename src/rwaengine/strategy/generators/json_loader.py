@@ -23,8 +23,9 @@ Expected JSON structure::
 """
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Hashable, List, Tuple
 
 import pandas as pd
 from loguru import logger
@@ -33,6 +34,14 @@ from src.rwaengine.strategy.base import ViewGenerator
 from src.rwaengine.strategy.types import InvestorView
 
 
+@lru_cache(maxsize=16)
+def _read_view_file(path: str, mtime: int) -> Dict[str, Any]:
+    """Parse a view file.  *mtime* is part of the cache key only, so an
+    edited file is picked up on the next call."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class JsonViewGenerator(ViewGenerator):
     """Loads investor views from a static JSON configuration file."""
 
@@ -50,6 +59,11 @@ class JsonViewGenerator(ViewGenerator):
         self.portfolio_name = portfolio_name
         self.file_path = Path(os.getcwd()) / view_file
 
+        # Validated views per (file mtime, asset universe).  Backtests ask
+        # for the same universe at every rebalance, so the InvestorView
+        # objects are built once instead of per call.
+        self._views_cache: Dict[Tuple[Hashable, ...], List[InvestorView]] = {}
+
     def generate_views(self, current_prices: pd.Series) -> List[InvestorView]:
         """Parse the JSON file and return validated views.
 
@@ -67,20 +81,29 @@ class JsonViewGenerator(ViewGenerator):
             f"for portfolio '{self.portfolio_name}'..."
         )
 
-        if not self.file_path.exists():
+        try:
+            mtime = self.file_path.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"View file not found: {self.file_path}")
             return []
 
+        key = (mtime, tuple(current_prices.index))
+        cached = self._views_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_view_file(str(self.file_path), mtime)
 
             raw_views = data.get(self.portfolio_name, [])
             valid_views: List[InvestorView] = []
 
+            # Plain set membership instead of pandas Index.__contains__.
+            available = set(current_prices.index)
+
             for v_data in raw_views:
                 assets = v_data.get("assets", [])
-                if not all(a in current_prices.index for a in assets):
+                if not available.issuperset(assets):
                     logger.warning(
                         f"Skipping view '{v_data.get('description')}' — "
                         "one or more assets missing from market data."
@@ -89,7 +112,8 @@ class JsonViewGenerator(ViewGenerator):
 
                 valid_views.append(InvestorView(**v_data))
 
-            return valid_views
+            self._views_cache[key] = valid_views
+            return list(valid_views)
 
         except Exception as e:
             logger.error(f"Failed to load JSON views: {e}")
@@ -92,11 +92,21 @@ class GeminiViewGenerator(ViewGenerator):
         "Tier 3": 0.00,
     }
 
-    def __init__(self, api_key: str, model_name: str = "gemini-2.0-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "gemini-2.0-flash",
+        max_concurrency: int = 8,
+        max_batch_size: int = 8,
+    ):
         """
         Args:
             api_key: Google AI API key.
             model_name: Gemini model identifier.
+            max_concurrency: Upper bound on in-flight Gemini requests.
+            max_batch_size: Most tickers scored in a single request.  Larger
+                            universes are split into chunks that are sent
+                            concurrently.
 
         Raises:
             ValueError: If *api_key* is empty or ``None``.
@@ -104,6 +114,8 @@ class GeminiViewGenerator(ViewGenerator):
         if not api_key:
             raise ValueError("Gemini API key is required for the LLM strategy.")
 
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
         self._search_tool = Tool(google_search=GoogleSearch())
 
         # Temperature 0 for deterministic data extraction.
@@ -116,6 +128,9 @@ class GeminiViewGenerator(ViewGenerator):
         self.parser = PydanticOutputParser(
             pydantic_object=InvestorViewsScorecardList
         )
+        # Rendering the instructions walks the JSON schema; the schema never
+        # changes, so render once rather than per request.
+        self._format_instructions = self.parser.get_format_instructions()
 
     # ------------------------------------------------------------------
     # Prompt construction
@@ -242,6 +257,52 @@ Populate the Scorecard JSON.
             ),
         )
 
+    # ------------------------------------------------------------------
+    # Chain assembly
+    # ------------------------------------------------------------------
+
+    def _build_chain(self, tickers: List[str], market_summary: str):
+        """Assemble prompt → tool-bound LLM → parser."""
+        prompt = self._construct_prompt(tickers, market_summary)
+        return prompt | self.llm.bind_tools([self._search_tool]) | self.parser
+
+    def _chain_inputs(self, current_prices: pd.Series) -> dict:
+        """Template variables for one price snapshot."""
+        today = date.today()
+        return {
+            "tickers": ", ".join(current_prices.index.tolist()),
+            "market_summary": current_prices.to_string(),
+            "current_date": today.isoformat(),
+            "current_month_str": today.strftime("%B %Y"),
+            "format_instructions": self._format_instructions,
+        }
+
+    def _chunk(self, current_prices: pd.Series) -> List[pd.Series]:
+        """Split a snapshot into groups of at most ``max_batch_size`` tickers.
+
+        Every ticker in a group shares one request, so the system prompt is
+        paid once per group rather than once per ticker.
+        """
+        size = self.max_batch_size
+        return [
+            current_prices.iloc[i:i + size]
+            for i in range(0, len(current_prices), size)
+        ]
+
+    def _scorecards_to_views(
+        self,
+        result: InvestorViewsScorecardList,
+        current_prices: pd.Series,
+    ) -> List[InvestorView]:
+        """Calibrate every scorecard and drop the filtered-out signals."""
+        final_views: List[InvestorView] = []
+        for card in result.views:
+            fallback_price = current_prices.get(card.ticker, 100.0)
+            view = self._calculate_implied_view(card, fallback_price)
+            if view:
+                final_views.append(view)
+        return final_views
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -249,6 +310,9 @@ Populate the Scorecard JSON.
     def generate_views(self, current_prices: pd.Series) -> List[InvestorView]:
         """Query Gemini for each ticker and return calibrated investor views.
 
+        Tickers are scored in batched requests of up to ``max_batch_size``;
+        see :meth:`generate_views_batch`.
+
         Args:
             current_prices: Series indexed by ticker with the latest prices.
 
@@ -257,39 +321,66 @@ Populate the Scorecard JSON.
             fails or all signals are filtered out).
         """
         tickers = current_prices.index.tolist()
-        today = date.today()
-        current_month_str = today.strftime("%B %Y")
-
         logger.info(f"Scoring views for {tickers} via Gemini scorecard...")
 
-        market_summary = current_prices.to_string()
-        prompt = self._construct_prompt(tickers, market_summary)
-
         try:
-            chain = (
-                prompt
-                | self.llm.bind_tools([self._search_tool])
-                | self.parser
-            )
+            final_views = self.generate_views_batch([current_prices])[0]
+        except Exception as e:
+            logger.error(f"LLM scoring failed: {e}")
+            return []
 
-            result = chain.invoke({
-                "tickers": ", ".join(tickers),
-                "market_summary": market_summary,
-                "current_date": today.isoformat(),
-                "current_month_str": current_month_str,
-                "format_instructions": self.parser.get_format_instructions(),
-            })
+        logger.success(f"Generated {len(final_views)} calibrated views.")
+        return final_views
 
-            final_views: List[InvestorView] = []
-            for card in result.views:
-                fallback_price = current_prices.get(card.ticker, 100.0)
-                view = self._calculate_implied_view(card, fallback_price)
-                if view:
-                    final_views.append(view)
+    def generate_views_batch(
+        self, snapshots: List[pd.Series]
+    ) -> List[List[InvestorView]]:
+        """Score several price snapshots with concurrent Gemini requests.
 
-            logger.success(f"Generated {len(final_views)} calibrated views.")
-            return final_views
+        Each snapshot is split into ticker groups of at most
+        ``max_batch_size``, and one request is built per group.  All
+        requests share one chain; LangChain's ``batch`` fans them out over a
+        bounded thread pool (``max_concurrency``) instead of paying each
+        round trip back to back.  Transient API errors (429/503) are retried
+        with backoff by the underlying ``ChatGoogleGenerativeAI`` client.  A
+        failed request drops only its own group's views.
 
-        except Exception as e:
-            logger.error(f"LLM scoring failed: {e}")
-            return []
\ No newline at end of file
+        Args:
+            snapshots: Price series (ticker → price), one per request.
+
+        Returns:
+            One list of views per snapshot, in input order.
+        """
+        if not snapshots:
+            return []
+
+        tickers = snapshots[0].index.tolist()
+        logger.info(
+            f"Scoring views for {len(snapshots)} snapshots of {tickers} "
+            f"via Gemini (max_concurrency={self.max_concurrency})..."
+        )
+
+        # Flatten (snapshot, ticker group) pairs into one request list.
+        owners: List[int] = []
+        groups: List[pd.Series] = []
+        for i, prices in enumerate(snapshots):
+            for group in self._chunk(prices):
+                owners.append(i)
+                groups.append(group)
+
+        chain = self._build_chain(tickers, snapshots[0].to_string())
+        results = chain.batch(
+            [self._chain_inputs(group) for group in groups],
+            config={"max_concurrency": self.max_concurrency},
+            return_exceptions=True,
+        )
+
+        batched: List[List[InvestorView]] = [[] for _ in snapshots]
+        for owner, result in zip(owners, results):
+            if isinstance(result, Exception):
+                logger.error(f"LLM scoring failed: {result}")
+            else:
+                batched[owner].extend(
+                    self._scorecards_to_views(result, snapshots[owner])
+                )
+        return batched
@@ -43,11 +43,15 @@ class ManualViewGenerator(ViewGenerator):
         """
         logger.info("Generating manual views...")
 
+        # Built once so each membership test is a hash lookup rather than
+        # an Index.__contains__ call.
+        available = set(current_prices.index)
+
         valid_views: List[InvestorView] = []
         for v_data in self.raw_views:
             try:
                 assets = v_data.get("assets", [])
-                missing = [a for a in assets if a not in current_prices.index]
+                missing = [a for a in assets if a not in available]
 
                 if missing:
                     logger.warning(
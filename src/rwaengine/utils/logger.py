@@ -8,7 +8,9 @@ Sets up two logging sinks with different verbosity levels:
     rotation with automatic compression and 30-day retention.
 
 Call ``setup_logger()`` once at application startup (before any other
-``logger`` usage) to activate both sinks.
+``logger`` usage) to activate both sinks.  Entry points that may log from
+worker processes pass ``enqueue=True`` so the file sink is written through
+Loguru's multiprocess-safe queue.
 """
 import sys
 from pathlib import Path
@@ -16,12 +18,16 @@ from pathlib import Path
 from loguru import logger
 
 
-def setup_logger(log_dir: str = "logs") -> logger:
+def setup_logger(log_dir: str = "logs", enqueue: bool = False) -> logger:
     """Configure and return the global Loguru logger.
 
     Args:
         log_dir: Directory for rotated log files.  Created automatically
                  if it does not exist.
+        enqueue: Route file-sink writes through a queue and a background
+                 writer thread.  Required when several processes share the
+                 log file; single-process runs write directly and skip the
+                 per-record queue hand-off.
 
     Returns:
         The configured ``logger`` instance (same singleton used everywhere
@@ -59,7 +65,7 @@ def setup_logger(log_dir: str = "logs") -> logger:
             "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | "
             "{name}:{function}:{line} - {message}"
         ),
-        enqueue=True,
+        enqueue=enqueue,
         encoding="utf-8",
     )
 
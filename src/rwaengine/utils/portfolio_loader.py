@@ -5,7 +5,9 @@ Portfolio definition loader.
 Reads a JSON file that maps portfolio names (e.g. ``"mag_seven"``) to
 lists of ticker symbols and caches the result in memory.  The file is
 loaded eagerly at construction time so that configuration errors surface
-immediately rather than mid-pipeline.
+immediately rather than mid-pipeline.  Parsed files are memoized per
+process (keyed on path and modification time), so constructing several
+loaders does not re-read an unchanged file.
 
 Expected JSON structure::
 
@@ -16,12 +18,21 @@ Expected JSON structure::
 """
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
 from loguru import logger
 
 
+@lru_cache(maxsize=8)
+def _read_portfolio_file(path: str, mtime: float) -> Dict[str, List[str]]:
+    """Parse a portfolio file.  *mtime* is part of the cache key only, so
+    an edited file is picked up on the next load."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class PortfolioLoader:
     """Loads and caches portfolio → ticker mappings from a JSON file."""
 
@@ -56,8 +67,9 @@ class PortfolioLoader:
             )
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                self._cache = json.load(f)
+            self._cache = _read_portfolio_file(
+                str(self.file_path), self.file_path.stat().st_mtime,
+            )
             logger.info(
                 f"Loaded portfolio definitions from {self.file_path.name}"
             )
@@ -85,7 +97,8 @@ class PortfolioLoader:
             )
             raise KeyError(f"Unknown portfolio: {portfolio_name}")
 
-        tickers = self._cache[portfolio_name]
+        # Copy so callers can't mutate the shared, memoized definitions.
+        tickers = list(self._cache[portfolio_name])
         logger.info(
             f"Selected portfolio '{portfolio_name}': {len(tickers)} assets"
         )
@@ -0,0 +1,33 @@
+"""
+Date helpers for market-data windows.
+
+Entry points request history up to "today".  Because yfinance treats the
+end date as exclusive, runs on a Saturday, Sunday or the following Monday
+all receive the same bars (through Friday) but would otherwise produce
+different cache keys.  The helpers here normalise the window end so that
+identical data maps to an identical request.
+"""
+from datetime import date, timedelta
+from typing import Optional
+
+import pandas as pd
+
+
+def last_session_end(today: Optional[date] = None) -> date:
+    """Return an exclusive end date covering the last completed weekday session.
+
+    The result is the day after the most recent weekday strictly before
+    *today*, so the fetched bars are exactly those an ``end=today`` request
+    would return.  Only weekends are skipped.  Exchange holidays are not
+    modelled, because a calendar that marks an open day as a holiday would
+    silently drop that session's data.
+
+    Args:
+        today: Reference date; defaults to ``date.today()``.
+
+    Returns:
+        The normalised exclusive end date.
+    """
+    today = today or date.today()
+    last_session = (pd.Timestamp(today) - pd.offsets.BDay(1)).date()
+    return last_session + timedelta(days=1)
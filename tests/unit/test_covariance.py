@@ -0,0 +1,44 @@
+"""
+test_covariance.py
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.rwaengine.core import covariance
+
+
+def test_concurrent_callers_share_one_estimate(monkeypatch):
+    rng = np.random.default_rng(3)
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (300, 4)), axis=0)),
+        index=pd.bdate_range("2024-01-01", periods=300),
+        columns=["A", "B", "C", "D"],
+    )
+
+    calls = []
+    real_ledoit_wolf = covariance.ledoit_wolf
+
+    def slow_ledoit_wolf(x):
+        calls.append(1)
+        time.sleep(0.2)  # Keep the estimate in flight while the peer arrives.
+        return real_ledoit_wolf(x)
+
+    monkeypatch.setattr(covariance, "ledoit_wolf", slow_ledoit_wolf)
+    monkeypatch.setattr(covariance, "_cache", type(covariance._cache)())
+
+    start = threading.Barrier(2)
+
+    def estimate():
+        start.wait()
+        return covariance.ledoit_wolf_covariance(prices)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, second = pool.map(lambda _: estimate(), range(2))
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert first is not second
@@ -0,0 +1,37 @@
+"""
+test_nav_reporter.py
+"""
+import pytest
+
+from src.rwaengine.oracle.nav_reporter import NAVReporter
+from src.rwaengine.oracle.schemas import SignedOracleResponse
+
+# Throwaway key used only to sign test payloads.
+_TEST_KEY = "0x" + "11" * 32
+
+
+@pytest.mark.parametrize(
+    "allocation",
+    [
+        # Rounds up to 10 001 bps with an empty cash leg.
+        {"A": 0.33336, "B": 0.33336, "C": 0.33333, "USDC": 0.0},
+        # Rounds down to 9 999 bps.
+        {"A": 0.33334, "B": 0.33334, "C": 0.33332, "USDC": 0.0},
+        # No cash leg at all.
+        {"A": 0.33336, "B": 0.33336, "C": 0.33333},
+        {"A": 0.6, "B": 0.3, "USDC": 0.1},
+    ],
+)
+def test_signed_bps_sum_to_10000_and_are_non_negative(allocation):
+    result = NAVReporter(_TEST_KEY).generate_payload("demo", allocation, nonce=1)
+    bps = [a["weight_bps"] for a in result["data"]["allocations"]]
+    assert sum(bps) == 10_000
+    assert all(b >= 0 for b in bps)
+
+
+def test_response_matches_signed_oracle_response_schema():
+    reporter = NAVReporter(_TEST_KEY)
+    result = reporter.generate_payload("demo", {"A": 0.7, "USDC": 0.3}, nonce=7)
+    response = SignedOracleResponse.model_validate(result)
+    assert response.model_dump() == result
+    assert response.signer_address == reporter._signer_address
@@ -0,0 +1,49 @@
+"""
+test_optimization.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pypfopt import EfficientFrontier
+
+from src.rwaengine.core.optimization import max_sharpe, tangency_weights
+
+TICKERS = ["A", "B", "C", "D"]
+
+
+def _cov() -> pd.DataFrame:
+    vols = np.array([0.20, 0.25, 0.30, 0.18])
+    corr = np.full((4, 4), 0.3) + 0.7 * np.eye(4)
+    return pd.DataFrame(np.outer(vols, vols) * corr, index=TICKERS, columns=TICKERS)
+
+
+def _solver_weights(mu: pd.Series, cov: pd.DataFrame) -> dict:
+    ef = EfficientFrontier(mu, cov)
+    ef.max_sharpe(risk_free_rate=0.04)
+    return ef.clean_weights()
+
+
+def test_closed_form_matches_solver_when_long_only():
+    mu = pd.Series([0.10, 0.12, 0.14, 0.09], index=TICKERS)
+    cov = _cov()
+    assert tangency_weights(mu, cov) is not None
+
+    weights, _ = max_sharpe(mu, cov)
+    expected = _solver_weights(mu, cov)
+    assert list(weights) == TICKERS
+    for t in TICKERS:
+        assert weights[t] == pytest.approx(expected[t], abs=1e-4)
+
+
+def test_falls_back_to_solver_when_tangency_would_short():
+    # D's return is below the risk-free rate, so the unconstrained
+    # tangency portfolio shorts it.
+    mu = pd.Series([0.10, 0.12, 0.14, 0.01], index=TICKERS)
+    cov = _cov()
+    assert tangency_weights(mu, cov) is None
+
+    weights, _ = max_sharpe(mu, cov)
+    expected = _solver_weights(mu, cov)
+    assert all(w >= 0 for w in weights.values())
+    for t in TICKERS:
+        assert weights[t] == pytest.approx(expected[t], abs=1e-4)
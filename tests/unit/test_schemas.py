@@ -0,0 +1,36 @@
+"""
+test_schemas.py
+"""
+import pandas as pd
+import pytest
+
+from src.rwaengine.data.schemas import MarketData
+
+
+def _frame(**overrides):
+    row = {
+        "trade_date": pd.Timestamp("2026-10-14"),
+        "ticker": "AAPL",
+        "open_price": 10.0,
+        "high_price": 11.0,
+        "low_price": 9.0,
+        "close_price": 10.5,
+        "volume": 1000,
+        "adj_close": 10.4,
+    }
+    row.update(overrides)
+    return pd.DataFrame([row, {**row, "ticker": "MSFT"}])
+
+
+def test_valid_frame_passes():
+    MarketData.validate_frame(_frame())
+    MarketData.validate_frame(_frame(adj_close=float("nan"), volume=0))
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"low_price": 0.0}, {"high_price": 8.0}, {"volume": -1}, {"adj_close": -1.0}],
+)
+def test_invalid_rows_raise(overrides):
+    with pytest.raises(ValueError, match="row 0"):
+        MarketData.validate_frame(_frame(**overrides))
@@ -0,0 +1,17 @@
+"""
+test_time_tools.py
+"""
+from datetime import date
+
+from src.rwaengine.utils.time_tools import last_session_end
+
+
+def test_weekend_and_monday_share_end_date():
+    # Sat 2026-10-17, Sun 2026-10-18 and Mon 2026-10-19 all see Friday's close.
+    expected = date(2026, 10, 17)
+    for day in (17, 18, 19):
+        assert last_session_end(date(2026, 10, day)) == expected
+
+
+def test_midweek_run_keeps_today():
+    assert last_session_end(date(2026, 10, 14)) == date(2026, 10, 14)